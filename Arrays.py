@@ -1,3 +1,57 @@
+import heapq
+import mmap
+import operator
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # optional: only used as a matmul fast path
+    np = None
+
+
+def _widen_for_matmul(left, right, inner):
+    """
+    Upcast NumPy operands so the product is as exact as the pure-Python
+    path: storage dtypes like uint8 would wrap silently. Integers go to
+    int64 when no dot product can exceed it, else to object (Python
+    ints); anything with floats goes to float64. The caller's typecode
+    still range-checks the result.
+    """
+    if left.size == 0 or right.size == 0:
+        return left, right
+    if left.dtype.kind in 'biu' and right.dtype.kind in 'biu':
+        bound = (max(int(left.max()), -int(left.min()))
+                 * max(int(right.max()), -int(right.min())) * inner)
+        dtype = np.int64 if bound < 2**63 else object
+    elif left.dtype.kind in 'biuf' and right.dtype.kind in 'biuf':
+        dtype = np.float64
+    else:
+        dtype = object
+    return left.astype(dtype), right.astype(dtype)
+
+
+def _make_storage(size, typecode=None):
+    """
+    Allocate backing storage for `size` slots
+    - typecode None: plain Python list (any object, boxed)
+    - typecode 'i', 'q', 'd', ...: compact array.array buffer (unboxed)
+    """
+    if typecode is None:
+        return [None] * size
+    itemsize = array(typecode).itemsize
+    return array(typecode, bytes(itemsize * size))
+
+
+def _blank_value(typecode=None):
+    """Value used for unused slots: None, or the zero of the typecode"""
+    if typecode is None:
+        return None
+    return array(typecode, bytes(array(typecode).itemsize))[0]
+
+
 class StaticArray:
     """
     Array implementation with fixed size
@@ -6,23 +60,100 @@ class StaticArray:
         - Search: O(n)
         - Insertion: O(n) (need to shift elements)
         - Deletion: O(n) (need to shift elements)
+    
+    Pass a typecode (e.g. 'i', 'q', 'd') to store elements unboxed in a
+    contiguous array.array buffer instead of a list of Python objects.
+    
+    Pass indexed=True to keep a value -> position hash index: membership
+    becomes O(1) and search O(1) expected. Appends keep the index exact;
+    mid-array shifts only mark positions stale, and the next search
+    rebuilds them in one pass (value counts are always exact).
     """
     
-    def __init__(self, size):
+    def __init__(self, size, typecode=None, indexed=False):
         self.size = size
-        self.array = [None] * size
+        self.typecode = typecode
+        self.array = _make_storage(size, typecode)
         self.length = 0
+        self._blank = _blank_value(typecode)
+        self.indexed = indexed
+        self._counts = {}
+        self._positions = {}
+        self._positions_stale = False
+    
+    def _index_written(self, index, count):
+        """Record count values just written at index (before length grows)"""
+        if not self.indexed:
+            return
+        values = self.array[index:index + count]
+        for value in values:
+            self._counts[value] = self._counts.get(value, 0) + 1
+        if index == self.length and not self._positions_stale:
+            for offset, value in enumerate(values):
+                self._positions.setdefault(value, index + offset)
+        else:
+            self._positions_stale = True
+    
+    def _index_removed(self, index, values):
+        """Forget values removed from index (before length shrinks)"""
+        if not self.indexed:
+            return
+        for value in values:
+            remaining = self._counts[value] - 1
+            if remaining:
+                self._counts[value] = remaining
+            else:
+                del self._counts[value]
+                self._positions.pop(value, None)
+        if index + len(values) < self.length:
+            self._positions_stale = True
+        elif any(self._positions.get(value, -1) >= index for value in values):
+            self._positions_stale = True
+    
+    def _index_replaced(self, index, old, new):
+        """Swap old for new at index (no elements move)"""
+        if not self.indexed:
+            return
+        remaining = self._counts[old] - 1
+        if remaining:
+            self._counts[old] = remaining
+            if self._positions.get(old) == index:
+                self._positions_stale = True
+        else:
+            del self._counts[old]
+            self._positions.pop(old, None)
+        self._counts[new] = self._counts.get(new, 0) + 1
+        if self._positions.get(new, index + 1) > index:
+            self._positions[new] = index
+    
+    def _rebuild_positions(self):
+        positions = {}
+        for i in range(self.length):
+            positions.setdefault(self.array[i], i)
+        self._positions = positions
+        self._positions_stale = False
+    
+    def index_memory(self):
+        """Bytes used by the value index dicts (0 when not indexed)"""
+        if not self.indexed:
+            return 0
+        return sys.getsizeof(self._counts) + sys.getsizeof(self._positions)
+    
+    def __contains__(self, value):
+        if self.indexed:
+            return value in self._counts
+        return self.search(value) != -1
     
     def insert(self, index, value):
         """Insert value at specific index"""
         if index < 0 or index > self.length or self.length >= self.size:
             raise IndexError("Index out of bounds or array is full")
         
-        # Shift elements to the right
-        for i in range(self.length, index, -1):
-    ]        self.array[i] = self.array[i-1]
+        # Shift elements to the right in one block move (memmove)
+        self.array[index + 1:self.length + 1] = self.array[index:self.length]
         
         self.array[index] = value
+        self._index_written(index, 1)
         self.length += 1
     
     def delete(self, index):
@@ -31,17 +162,61 @@ class StaticArray:
             raise IndexError("Index out of bounds")
         
         value = self.array[index]
+        self._index_removed(index, (value,))
         
-        # Shift elements to the left
-        for i in range(index, self.length - 1):
-            self.array[i] = self.array[i + 1]
+        # Shift elements to the left in one block move (memmove)
+        self.array[index:self.length - 1] = self.array[index + 1:self.length]
         
-        self.array[self.length - 1] = None
+        self.array[self.length - 1] = self._blank
         self.length -= 1
         return value
     
+    def _block(self, values):
+        """Materialise values in the same storage type as self.array"""
+        if self.typecode is None:
+            return list(values)
+        return array(self.typecode, values)
+    
+    def insert_many(self, index, values):
+        """Insert a batch at index - the tail is shifted once, not per item"""
+        block = self._block(values)
+        count = len(block)
+        if index < 0 or index > self.length or self.length + count > self.size:
+            raise IndexError("Index out of bounds or array is full")
+        
+        end = self.length + count
+        self.array[index + count:end] = self.array[index:self.length]
+        self.array[index:index + count] = block
+        self._index_written(index, count)
+        self.length = end
+    
+    def delete_range(self, start, stop):
+        """Delete elements in [start, stop) and return them as a list"""
+        if start < 0 or stop > self.length or start > stop:
+            raise IndexError("Index out of bounds")
+        
+        count = stop - start
+        removed = list(self.array[start:stop])
+        self._index_removed(start, removed)
+        self.array[start:self.length - count] = self.array[stop:self.length]
+        self.array[self.length - count:self.length] = self._block(
+            [self._blank] * count)
+        self.length -= count
+        return removed
+    
+    def extend(self, values):
+        """Append a batch at the end"""
+        self.insert_many(self.length, values)
+    
     def search(self, value):
-        """Linear search for a value"""
+        """Linear search for a value (hash lookup when indexed)"""
+        if self.indexed:
+            if value not in self._counts:
+                return -1
+            if self._positions_stale:
+                self._rebuild_positions()
+            return self._positions[value]
+        
         for i in range(self.length):
             if self.array[i] == value:
                 return i
@@ -57,30 +232,171 @@ class StaticArray:
         """Update element at index - O(1)"""
         if index < 0 or index >= self.length:
             raise IndexError("Index out of bounds")
+        old = self.array[index]
         self.array[index] = value
+        self._index_replaced(index, old, self.array[index])
     
     def display(self):
         """Display the array"""
         return [self.array[i] for i in range(self.length)]
+    
+    def view(self):
+        """Zero-copy memoryview of the used elements (typed storage only)"""
+        if self.typecode is None:
+            raise TypeError("view() requires a typecode-backed array")
+        return memoryview(self.array)[:self.length]
+    
+    def __buffer__(self, flags):
+        """Buffer protocol (Python 3.12+): memoryview(arr) without copying"""
+        return self.view()
+
+
+class SortedStaticArray(StaticArray):
+    """
+    StaticArray that keeps its elements in ascending order
+    Time Complexity:
+        - Search: O(log n) (binary search)
+        - add: O(log n) to find the slot + one block shift
+        - merge_sorted: O(n + k) single merge pass for a sorted batch of k
+    
+    Positional writes (insert/update/insert_many) are still allowed but
+    must keep the order; use add() to let the array pick the slot.
+    """
+    
+    def _fits(self, index, first, last, replaced=0):
+        """Would values first..last at index keep the array sorted?"""
+        if index > 0 and self.array[index - 1] > first:
+            return False
+        after = index + replaced
+        return after >= self.length or last <= self.array[after]
+    
+    def add(self, value):
+        """Insert value at its sorted position and return that position"""
+        index = bisect_right(self.array, value, 0, self.length)
+        super().insert(index, value)
+        return index
+    
+    def insert(self, index, value):
+        """Insert at index - only if value belongs there"""
+        if 0 <= index <= self.length and not self._fits(index, value, value):
+            raise ValueError("Insert would break sorted order")
+        super().insert(index, value)
+    
+    def update(self, index, value):
+        """Update element at index - only if the order is kept"""
+        if 0 <= index < self.length and not self._fits(index, value, value, 1):
+            raise ValueError("Update would break sorted order")
+        super().update(index, value)
+    
+    def insert_many(self, index, values):
+        """Insert a sorted batch at index - only if it belongs there"""
+        block = self._block(values)
+        if any(block[i] > block[i + 1] for i in range(len(block) - 1)):
+            raise ValueError("Batch is not sorted")
+        if block and 0 <= index <= self.length and not self._fits(index, block[0], block[-1]):
+            raise ValueError("Insert would break sorted order")
+        super().insert_many(index, block)
+    
+    def search(self, value):
+        """Binary search for a value - O(log n), -1 if absent"""
+        index = self.lower_bound(value)
+        if index < self.length and self.array[index] == value:
+            return index
+        return -1
+    
+    def lower_bound(self, value):
+        """First index whose element is >= value"""
+        return bisect_left(self.array, value, 0, self.length)
+    
+    def upper_bound(self, value):
+        """First index whose element is > value"""
+        return bisect_right(self.array, value, 0, self.length)
+    
+    def range_query(self, low, high):
+        """All elements with low <= element <= high, in order"""
+        return list(self.array[self.lower_bound(low):self.upper_bound(high)])
+    
+    def count_range(self, low, high):
+        """Number of elements with low <= element <= high - O(log n)"""
+        return max(0, self.upper_bound(high) - self.lower_bound(low))
+    
+    def merge_sorted(self, values):
+        """Merge a sorted batch in one linear pass instead of k inserts"""
+        block = self._block(values)
+        if any(block[i] > block[i + 1] for i in range(len(block) - 1)):
+            raise ValueError("Batch is not sorted")
+        end = self.length + len(block)
+        if end > self.size:
+            raise IndexError("Array is full")
+        
+        merged = self._block(heapq.merge(self.array[:self.length], block))
+        self.array[:end] = merged
+        if self.indexed:
+            for value in block:
+                self._counts[value] = self._counts.get(value, 0) + 1
+            self._positions_stale = True
+        self.length = end
 
 
 class DynamicArray:
     """
     Dynamic array that grows automatically (similar to Python list)
+    
+    Pass a typecode to keep elements in a compact array.array buffer.
+    
+    growth controls how capacity increases when full:
+        - a number > 1 (2 doubles, 1.5 grows by half)
+        - a callable taking the current capacity and returning the new one
+    Capacity halves once the array drops to a quarter full (hysteresis,
+    so alternating append/pop at the boundary never thrashes), but never
+    below the amount requested with reserve().
     """
     
-    def __init__(self):
+    def __init__(self, typecode=None, growth=2):
+        if not callable(growth) and growth <= 1:
+            raise ValueError("growth factor must be greater than 1")
         self.capacity = 1
         self.length = 0
-        self.array = [None] * self.capacity
-    
-    def _resize(self):
-        """Double the capacity when full"""
-        self.capacity *= 2
-        new_array = [None] * self.capacity
-        for i in range(self.length):
-            new_array[i] = self.array[i]
+        self.typecode = typecode
+        self.growth = growth
+        self.array = _make_storage(self.capacity, typecode)
+        self._blank = _blank_value(typecode)
+        self._reserved = 0
+    
+    def _next_capacity(self):
+        """Capacity after one growth step (always at least one more slot)"""
+        if callable(self.growth):
+            new_capacity = int(self.growth(self.capacity))
+        else:
+            new_capacity = int(self.capacity * self.growth)
+        return max(new_capacity, self.capacity + 1)
+    
+    def _resize(self, new_capacity=None):
+        """Move elements to storage of new_capacity (default: one growth step)"""
+        if new_capacity is None:
+            new_capacity = self._next_capacity()
+        new_array = _make_storage(new_capacity, self.typecode)
+        new_array[:self.length] = self.array[:self.length]
         self.array = new_array
+        self.capacity = new_capacity
+    
+    def reserve(self, n):
+        """Preallocate room for at least n elements"""
+        self._reserved = max(self._reserved, n)
+        if n > self.capacity:
+            self._resize(n)
+    
+    def shrink_to_fit(self):
+        """Release unused capacity (also drops any reserve() floor)"""
+        self._reserved = 0
+        if self.capacity > max(self.length, 1):
+            self._resize(max(self.length, 1))
+    
+    def _maybe_shrink(self):
+        """Halve capacity once only a quarter is in use"""
+        floor = max(self._reserved, 1)
+        if self.length <= self.capacity // 4 and self.capacity // 2 >= floor:
+            self._resize(self.capacity // 2)
     
     def append(self, value):
         """Add element at the end - Amortized O(1)"""
@@ -89,6 +405,28 @@ class DynamicArray:
         self.array[self.length] = value
         self.length += 1
     
+    def pop(self, index=None):
+        """Remove and return element at index (default last) - O(1) at end"""
+        if index is None:
+            index = self.length - 1
+        if index < 0 or index >= self.length:
+            raise IndexError("Index out of bounds")
+        
+        value = self.array[index]
+        self.array[index:self.length - 1] = self.array[index + 1:self.length]
+        self.array[self.length - 1] = self._blank
+        self.length -= 1
+        self._maybe_shrink()
+        return value
+    
+    def remove(self, value):
+        """Remove first occurrence of value"""
+        for i in range(self.length):
+            if self.array[i] == value:
+                self.pop(i)
+                return
+        raise ValueError(f"{value!r} not in array")
+    
     def get(self, index):
         """Get element at index"""
         if index < 0 or index >= self.length:
@@ -97,36 +435,368 @@ class DynamicArray:
     
     def display(self):
         return [self.array[i] for i in range(self.length)]
+    
+    def view(self):
+        """Zero-copy memoryview of the used elements (typed storage only)"""
+        if self.typecode is None:
+            raise TypeError("view() requires a typecode-backed array")
+        return memoryview(self.array)[:self.length]
+    
+    def __buffer__(self, flags):
+        """Buffer protocol (Python 3.12+): memoryview(arr) without copying"""
+        return self.view()
+
+
+class MappedStaticArray(StaticArray):
+    """
+    StaticArray whose elements live in a file, accessed through mmap
+    
+    File layout: a 16-byte header (magic, typecode, itemsize, length)
+    followed by `size` fixed-width records. Opening only maps the file;
+    the OS pages records in lazily as get/update/search touch them.
+    
+    Modes (explicit, like open()):
+        - 'r':  read-only, mutations raise PermissionError
+        - 'r+': read/write an existing file
+        - 'w+': create (or truncate) a file with room for `size` records
+    Changes reach disk on flush() or close(); usable as a context manager.
+    """
+    
+    HEADER = struct.Struct("<4scBxxQ")
+    MAGIC = b"SARR"
+    
+    def __init__(self, path, mode='r', typecode=None, size=None):
+        if mode not in ('r', 'r+', 'w+'):
+            raise ValueError("mode must be 'r', 'r+' or 'w+'")
+        
+        if mode == 'w+':
+            if typecode is None or size is None:
+                raise ValueError("mode 'w+' needs a typecode and a size")
+            itemsize = array(typecode).itemsize
+            with open(path, 'wb') as f:
+                f.write(self.HEADER.pack(self.MAGIC, typecode.encode(), itemsize, 0))
+                f.truncate(self.HEADER.size + size * itemsize)
+        
+        self.path = path
+        self.mode = mode
+        self.writable = mode != 'r'
+        self._file = open(path, 'r+b' if self.writable else 'rb')
+        access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+        
+        magic, stored_code, itemsize, length = self.HEADER.unpack_from(self._mmap)
+        stored_code = stored_code.decode()
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a StaticArray file")
+        if typecode is not None and typecode != stored_code:
+            self.close()
+            raise ValueError(f"file holds typecode {stored_code!r}, not {typecode!r}")
+        if array(stored_code).itemsize != itemsize:
+            self.close()
+            raise ValueError("record size differs from this platform's typecode size")
+        # A truncated file can hold fewer records than the header claims
+        records = (len(self._mmap) - self.HEADER.size) // itemsize
+        if length > records:
+            self.close()
+            raise ValueError(f"header says {length} elements but {path} "
+                             f"only has room for {records}")
+        
+        super().__init__(0, stored_code)
+        self._raw = memoryview(self._mmap)
+        end = self.HEADER.size + records * itemsize
+        self.array = self._raw[self.HEADER.size:end].cast(stored_code)
+        self.size = len(self.array)
+        self.length = length
+    
+    def _check_writable(self):
+        if not self.writable:
+            raise PermissionError("array was opened read-only")
+    
+    def insert(self, index, value):
+        self._check_writable()
+        super().insert(index, value)
+    
+    def delete(self, index):
+        self._check_writable()
+        return super().delete(index)
+    
+    def update(self, index, value):
+        self._check_writable()
+        super().update(index, value)
+    
+    def insert_many(self, index, values):
+        self._check_writable()
+        super().insert_many(index, values)
+    
+    def delete_range(self, start, stop):
+        self._check_writable()
+        return super().delete_range(start, stop)
+    
+    def flush(self):
+        """Write the length header and push dirty pages to disk"""
+        self._check_writable()
+        self.HEADER.pack_into(self._mmap, 0, self.MAGIC, self.typecode.encode(),
+                              self.array.itemsize, self.length)
+        self._mmap.flush()
+    
+    def close(self):
+        """Flush (if writable) and unmap; views from view() must be released first"""
+        if self._mmap.closed:
+            return
+        if self.writable and hasattr(self, 'array'):
+            self.flush()
+        for buf in (getattr(self, 'array', None), getattr(self, '_raw', None)):
+            if isinstance(buf, memoryview):
+                buf.release()
+        self._mmap.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _loop_insert(arr, index, value):
+    """Reference per-element shift (the pre-memmove insert) for benchmarks"""
+    for i in range(arr.length, index, -1):
+        arr.array[i] = arr.array[i - 1]
+    arr.array[index] = value
+    arr.length += 1
+
+
+def _loop_delete(arr, index):
+    """Reference per-element shift (the pre-memmove delete) for benchmarks"""
+    value = arr.array[index]
+    for i in range(index, arr.length - 1):
+        arr.array[i] = arr.array[i + 1]
+    arr.array[arr.length - 1] = arr._blank
+    arr.length -= 1
+    return value
+
+
+def benchmark_shifting(sizes=(10**3, 10**4, 10**5, 10**6), repeats=5):
+    """
+    Compare per-element loop shifting with block (slice) shifting
+    for a mid-array insert + delete pair. Pass sizes up to 10**7 for
+    large runs (the loop version takes seconds per edit at that size).
+    """
+    from time import perf_counter
+    
+    print(f"{'n':>10} | {'loop (ms)':>10} | {'block (ms)':>10} | {'speedup':>8}")
+    for n in sizes:
+        arr = StaticArray(n + 1)
+        arr.extend(range(n))
+        mid = n // 2
+        
+        start = perf_counter()
+        for _ in range(repeats):
+            _loop_insert(arr, mid, -1)
+            _loop_delete(arr, mid)
+        loop_ms = (perf_counter() - start) * 1000 / repeats
+        
+        start = perf_counter()
+        for _ in range(repeats):
+            arr.insert(mid, -1)
+            arr.delete(mid)
+        block_ms = (perf_counter() - start) * 1000 / repeats
+        
+        print(f"{n:>10} | {loop_ms:>10.3f} | {block_ms:>10.3f} | "
+              f"{loop_ms / block_ms:>7.1f}x")
 
 
 class MultiDimensionalArray:
     """
     2D Array (Matrix) implementation
     Used in image processing, game boards, etc.
+    
+    Elements live in one flat contiguous buffer, row-major (order='C')
+    or column-major (order='F'); (row, col) maps to a single offset.
+    Bulk operations (fill, row/column slices, elementwise math,
+    transpose, matmul) work on whole slices instead of cell by cell.
+    matmul uses NumPy when it is installed.
     """
     
-    def __init__(self, rows, cols):
+    def __init__(self, rows, cols, order='C', typecode=None):
+        if order not in ('C', 'F'):
+            raise ValueError("order must be 'C' (row-major) or 'F' (column-major)")
         self.rows = rows
         self.cols = cols
-        self.matrix = [[0 for _ in range(cols)] for _ in range(rows)]
+        self.order = order
+        self.typecode = typecode
+        if typecode is None:
+            self.data = [0] * (rows * cols)
+        else:
+            self.data = _make_storage(rows * cols, typecode)
+    
+    @classmethod
+    def from_rows(cls, rows, order='C', typecode=None):
+        """Build a matrix from a list of equal-length rows"""
+        matrix = cls(len(rows), len(rows[0]) if rows else 0, order, typecode)
+        for i, values in enumerate(rows):
+            matrix.set_row(i, values)
+        return matrix
+    
+    def _offset(self, row, col):
+        if self.order == 'C':
+            return row * self.cols + col
+        return col * self.rows + row
+    
+    def _block(self, values):
+        if self.typecode is None:
+            return list(values)
+        return array(self.typecode, values)
+    
+    def _new(self, rows, cols, data):
+        """Matrix of the same order/typecode wrapping already-ordered data"""
+        matrix = MultiDimensionalArray(rows, cols, self.order, self.typecode)
+        matrix.data = self._block(data)
+        return matrix
     
     def set(self, row, col, value):
         """Set value at position (row, col)"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            self.matrix[row][col] = value
+            self.data[self._offset(row, col)] = value
         else:
             raise IndexError("Position out of bounds")
     
     def get(self, row, col):
         """Get value at position (row, col)"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            return self.matrix[row][col]
+            return self.data[self._offset(row, col)]
         else:
             raise IndexError("Position out of bounds")
     
+    def _row_slice(self, row):
+        if not 0 <= row < self.rows:
+            raise IndexError("Row out of bounds")
+        if self.order == 'C':
+            return slice(row * self.cols, (row + 1) * self.cols)
+        return slice(row, None, self.rows)
+    
+    def _col_slice(self, col):
+        if not 0 <= col < self.cols:
+            raise IndexError("Column out of bounds")
+        if self.order == 'C':
+            return slice(col, None, self.cols)
+        return slice(col * self.rows, (col + 1) * self.rows)
+    
+    def row(self, row):
+        """Copy of one row, taken with a single slice"""
+        return list(self.data[self._row_slice(row)])
+    
+    def col(self, col):
+        """Copy of one column, taken with a single (strided) slice"""
+        return list(self.data[self._col_slice(col)])
+    
+    def set_row(self, row, values):
+        """Overwrite a whole row in one slice assignment"""
+        values = self._block(values)
+        if len(values) != self.cols:
+            raise ValueError("Row length does not match matrix width")
+        self.data[self._row_slice(row)] = values
+    
+    def set_col(self, col, values):
+        """Overwrite a whole column in one slice assignment"""
+        values = self._block(values)
+        if len(values) != self.rows:
+            raise ValueError("Column length does not match matrix height")
+        self.data[self._col_slice(col)] = values
+    
+    def submatrix(self, row_start, row_stop, col_start, col_stop):
+        """Copy of the block rows [row_start, row_stop) x cols [col_start, col_stop)"""
+        if not (0 <= row_start <= row_stop <= self.rows and
+                0 <= col_start <= col_stop <= self.cols):
+            raise IndexError("Block out of bounds")
+        rows = [self.row(i)[col_start:col_stop] for i in range(row_start, row_stop)]
+        return MultiDimensionalArray.from_rows(rows, self.order, self.typecode)
+    
+    def view(self):
+        """Zero-copy memoryview of the flat buffer (typed storage only)"""
+        if self.typecode is None:
+            raise TypeError("view() requires a typecode-backed matrix")
+        return memoryview(self.data)
+    
+    def fill(self, value):
+        """Set every element to value"""
+        self.data[:] = self._block([value] * (self.rows * self.cols))
+    
+    def _data_in(self, order):
+        """Flat data laid out in the requested order"""
+        if order == self.order:
+            return self.data
+        if self.order == 'C':
+            lines = (self.data[j::self.cols] for j in range(self.cols))
+        else:
+            lines = (self.data[i::self.rows] for i in range(self.rows))
+        return [value for line in lines for value in line]
+    
+    def to_rows(self):
+        """Nested list of rows"""
+        return [self.row(i) for i in range(self.rows)]
+    
+    def _check_same_shape(self, other):
+        if (self.rows, self.cols) != (other.rows, other.cols):
+            raise ValueError("Matrix shapes do not match")
+    
+    def add(self, other):
+        """Elementwise sum"""
+        self._check_same_shape(other)
+        data = map(operator.add, self.data, other._data_in(self.order))
+        return self._new(self.rows, self.cols, data)
+    
+    def mul(self, other):
+        """Elementwise (Hadamard) product"""
+        self._check_same_shape(other)
+        data = map(operator.mul, self.data, other._data_in(self.order))
+        return self._new(self.rows, self.cols, data)
+    
+    def scale(self, factor):
+        """Multiply every element by factor"""
+        return self._new(self.rows, self.cols,
+                         [value * factor for value in self.data])
+    
+    def transpose(self):
+        """Transposed copy - data re-laid out with strided slices"""
+        # The transpose of a row-major matrix has its column-major layout
+        flipped = 'F' if self.order == 'C' else 'C'
+        return self._new(self.cols, self.rows, self._data_in(flipped))
+    
+    def matmul(self, other):
+        """Matrix product self @ other (NumPy when available)"""
+        if self.cols != other.rows:
+            raise ValueError("Inner dimensions do not match")
+        
+        if np is not None:
+            left, right = _widen_for_matmul(np.asarray(self.data),
+                                            np.asarray(other.data), self.cols)
+            left = left.reshape(self.rows, self.cols, order=self.order)
+            right = right.reshape(other.rows, other.cols, order=other.order)
+            product = left @ right
+            return self._new(self.rows, other.cols,
+                             product.ravel(order=self.order).tolist())
+        
+        columns = [other.col(j) for j in range(other.cols)]
+        rows = [[sum(map(operator.mul, row, column)) for column in columns]
+                for row in self.to_rows()]
+        return MultiDimensionalArray.from_rows(rows, self.order, self.typecode)
+    
+    def __add__(self, other):
+        return self.add(other)
+    
+    def __mul__(self, other):
+        if isinstance(other, MultiDimensionalArray):
+            return self.mul(other)
+        return self.scale(other)
+    
+    def __matmul__(self, other):
+        return self.matmul(other)
+    
     def display(self):
         """Display the matrix"""
-        for row in self.matrix:
+        for row in self.to_rows():
             print(row)
 
 
@@ -165,6 +835,39 @@ if __name__ == "__main__":
     print(f"Deleted value: {deleted}")
     print(f"Array: {arr.display()}")
     
+    # Batch operations
+    print("\nInserting batch [21, 22, 23] at index 2")
+    arr.insert_many(2, [21, 22, 23])
+    print(f"Array: {arr.display()}")
+    print(f"Deleted range [2, 5): {arr.delete_range(2, 5)}")
+    arr.extend([60, 70])
+    print(f"After extend([60, 70]): {arr.display()}")
+    
+    print("\n" + "=" * 60)
+    print("INDEXED ARRAY DEMONSTRATION")
+    print("=" * 60)
+    
+    skus = StaticArray(10, indexed=True)
+    skus.extend(["SKU-7", "SKU-3", "SKU-9"])
+    skus.insert(0, "SKU-1")
+    print(f"\nArray: {skus.display()}")
+    print(f"Hash lookup of 'SKU-9': index {skus.search('SKU-9')}")
+    print(f"'SKU-4' in array: {'SKU-4' in skus}")
+    print(f"Index overhead: {skus.index_memory()} bytes")
+    
+    print("\n" + "=" * 60)
+    print("SORTED ARRAY DEMONSTRATION")
+    print("=" * 60)
+    
+    sorted_arr = SortedStaticArray(20)
+    for val in [40, 10, 30, 20, 50]:
+        sorted_arr.add(val)
+    print(f"\nAdded 40, 10, 30, 20, 50: {sorted_arr.display()}")
+    print(f"Binary search for 30: index {sorted_arr.search(30)}")
+    print(f"Range [15, 45]: {sorted_arr.range_query(15, 45)}")
+    sorted_arr.merge_sorted([5, 25, 60])
+    print(f"After merge_sorted([5, 25, 60]): {sorted_arr.display()}")
+    
     print("\n" + "=" * 60)
     print("DYNAMIC ARRAY DEMONSTRATION")
     print("=" * 60)
@@ -176,6 +879,51 @@ if __name__ == "__main__":
     print(f"Dynamic Array: {dyn_arr.display()}")
     print(f"Capacity: {dyn_arr.capacity}, Length: {dyn_arr.length}")
     
+    print("\nGrowth 1.5x with reserve(100), then popping 95 elements:")
+    buffer = DynamicArray(growth=1.5)
+    buffer.reserve(100)
+    for val in range(100):
+        buffer.append(val)
+    for _ in range(95):
+        buffer.pop()
+    print(f"Capacity: {buffer.capacity}, Length: {buffer.length} (reserve floor kept)")
+    buffer.shrink_to_fit()
+    print(f"After shrink_to_fit(): Capacity: {buffer.capacity}")
+    for _ in range(2):
+        buffer.append(0)
+    buffer.remove(3)
+    print(f"After 2 appends and remove(3): {buffer.display()}, Capacity: {buffer.capacity}")
+    
+    print("\n" + "=" * 60)
+    print("TYPED (COMPACT) ARRAY DEMONSTRATION")
+    print("=" * 60)
+    
+    typed = DynamicArray(typecode='q')
+    for val in range(1000):
+        typed.append(val)
+    buf = typed.view()
+    print(f"\n1000 int64 values in {buf.nbytes} bytes of contiguous storage")
+    print(f"Zero-copy view: format={buf.format!r}, first five={buf[:5].tolist()}")
+    
+    print("\n" + "=" * 60)
+    print("MEMORY-MAPPED ARRAY DEMONSTRATION")
+    print("=" * 60)
+    
+    import os
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "readings.sarr")
+    with MappedStaticArray(path, 'w+', typecode='d', size=1000) as disk_arr:
+        disk_arr.extend([1.5, 2.5, 3.5])
+    print(f"\nWrote 3 doubles to {os.path.basename(path)} "
+          f"({os.path.getsize(path)} bytes on disk)")
+    with MappedStaticArray(path, 'r') as disk_arr:
+        print(f"Reopened read-only: {disk_arr.display()}, search(2.5) -> {disk_arr.search(2.5)}")
+        try:
+            disk_arr.update(0, 9.9)
+        except PermissionError as e:
+            print(f"Update rejected: {e}")
+    os.remove(path)
+    
     print("\n" + "=" * 60)
     print("2D ARRAY (MATRIX) DEMONSTRATION")
     print("=" * 60)
@@ -186,6 +934,16 @@ if __name__ == "__main__":
         matrix.set(i, i, 1)
     matrix.display()
     
+    print("\nBulk operations on a 2x3 matrix M:")
+    m = MultiDimensionalArray.from_rows([[1, 2, 3], [4, 5, 6]])
+    m.display()
+    print("M transposed:")
+    m.transpose().display()
+    print("M @ M^T:")
+    (m @ m.transpose()).display()
+    print("M + M * 2 (elementwise):")
+    (m + m * 2).display()
+    
     print("\n" + "=" * 60)
     print("REAL-WORLD APPLICATION EXAMPLES")
     print("=" * 60)
@@ -207,8 +965,7 @@ if __name__ == "__main__":
     
     # Example 2: Image representation (2D array)
     print("\n2. Simple 5x5 Grayscale Image (0=black, 255=white):")
-    image = MultiDimensionalArray(5, 5)
-    # Create a simple pattern
+    # Create a simple pattern, loaded row by row into a byte buffer
     pattern = [
         [0, 0, 255, 0, 0],
         [0, 255, 0, 255, 0],
@@ -216,9 +973,12 @@ if __name__ == "__main__":
         [0, 255, 0, 255, 0],
         [0, 0, 255, 0, 0]
     ]
-    for i in range(5):
-        for j in range(5):
-            image.set(i, j, pattern[i][j])
+    image = MultiDimensionalArray.from_rows(pattern, typecode='B')
     image.display()
     
     print("\n" + "=" * 60)
+    print("BENCHMARK: LOOP SHIFT vs BLOCK SHIFT (mid-array insert + delete)")
+    print("=" * 60)
+    benchmark_shifting(sizes=(10**3, 10**4, 10**5))
+    
+    print("\n" + "=" * 60)
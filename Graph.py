@@ -4,8 +4,12 @@ GRAPHS - Non-Linear Data Structure (Simplified)
 Vertices (nodes) connected by edges
 """
 
+from array import array
 from collections import deque
+from contextlib import contextmanager
 import heapq
+import os
+import sys
 
 class Graph:
     """Undirected Graph using Adjacency List"""
@@ -31,59 +35,200 @@ class Graph:
             self.graph[v2] = []
         self.graph[v1].append(v2)
     
-    def bfs(self, start):
-        """Breadth-First Search - O(V + E)"""
-        visited = set()
+    def iter_bfs(self, start):
+        """Lazy Breadth-First Search - yields vertices as they are dequeued"""
+        visited = {start}
         queue = deque([start])
-        result = []
-        
-        visited.add(start)
         
         while queue:
             node = queue.popleft()
-            result.append(node)
+            yield node
             
             for neighbor in self.graph[node]:
                 if neighbor not in visited:
                     visited.add(neighbor)
                     queue.append(neighbor)
-        
-        return result
     
-    def dfs(self, start, visited=None):
-        """Depth-First Search - O(V + E)"""
+    def bfs(self, start):
+        """Breadth-First Search - O(V + E)"""
+        return list(self.iter_bfs(start))
+    
+    def iter_dfs(self, start, visited=None):
+        """
+        Lazy Depth-First Search with an explicit stack of neighbor
+        iterators - same visiting order as the recursive version,
+        but no recursion limit on long paths
+        """
         if visited is None:
             visited = set()
         
         visited.add(start)
-        result = [start]
-        
-        for neighbor in self.graph[start]:
-            if neighbor not in visited:
-                result.extend(self.dfs(neighbor, visited))
+        yield start
+        stack = [iter(self.graph[start])]
         
-        return result
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    yield neighbor
+                    stack.append(iter(self.graph[neighbor]))
+                    break
+            else:
+                stack.pop()
     
-    def has_path(self, start, end):
-        """Check if path exists"""
-        visited = set()
-        return self._has_path_helper(start, end, visited)
+    def dfs(self, start, visited=None):
+        """Depth-First Search - O(V + E)"""
+        return list(self.iter_dfs(start, visited))
     
-    def _has_path_helper(self, current, end, visited):
-        if current == end:
-            return True
-        visited.add(current)
-        
-        for neighbor in self.graph[current]:
-            if neighbor not in visited:
-                if self._has_path_helper(neighbor, end, visited):
-                    return True
-        return False
+    def has_path(self, start, end):
+        """Check if path exists (stops as soon as end is reached)"""
+        return any(node == end for node in self.iter_dfs(start))
     
     def display(self):
         """Display adjacency list"""
         for vertex in self.graph:
             print(f"{vertex} -> {self.graph[vertex]}")
+    
+    def freeze(self):
+        """Immutable CSR snapshot (see FrozenGraph) - O(V + E)"""
+        return FrozenGraph.from_adjacency(self.graph)
+
+
+class IndexedPriorityQueue:
+    """
+    Addressable binary min-heap: each item is queued at most once and
+    its priority can be lowered in place with decrease_key, so the heap
+    never holds more than one entry per item (lazy deletion with heapq
+    keeps every stale duplicate until it is popped).
+    - items / priorities: parallel heap-ordered lists
+    - position: item -> its slot in the heap
+    """
+    
+    def __init__(self):
+        self.items = []
+        self.priorities = []
+        self.position = {}
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __contains__(self, item):
+        return item in self.position
+    
+    def priority(self, item):
+        """Current priority of a queued item - O(1)"""
+        return self.priorities[self.position[item]]
+    
+    def peek(self):
+        """(item, priority) with the smallest priority - O(1)"""
+        if not self.items:
+            raise IndexError("peek from empty priority queue")
+        return self.items[0], self.priorities[0]
+    
+    def push(self, item, priority):
+        """Queue a new item - O(log n)"""
+        if item in self.position:
+            raise ValueError(f"{item!r} is already queued")
+        self.items.append(item)
+        self.priorities.append(priority)
+        self.position[item] = len(self.items) - 1
+        self._sift_up(len(self.items) - 1)
+    
+    def pop(self):
+        """Remove and return (item, priority) with the smallest priority - O(log n)"""
+        if not self.items:
+            raise IndexError("pop from empty priority queue")
+        item, priority = self.items[0], self.priorities[0]
+        last_item, last_priority = self.items.pop(), self.priorities.pop()
+        del self.position[item]
+        if self.items:
+            self.items[0], self.priorities[0] = last_item, last_priority
+            self.position[last_item] = 0
+            self._sift_down(0)
+        return item, priority
+    
+    def decrease_key(self, item, priority):
+        """Lower a queued item's priority in place - O(log n)"""
+        i = self.position[item]
+        if priority > self.priorities[i]:
+            raise ValueError("decrease_key cannot raise a priority")
+        self.priorities[i] = priority
+        self._sift_up(i)
+    
+    def _sift_up(self, i):
+        items, priorities, position = self.items, self.priorities, self.position
+        item, priority = items[i], priorities[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            if priorities[parent] <= priority:
+                break
+            items[i], priorities[i] = items[parent], priorities[parent]
+            position[items[i]] = i
+            i = parent
+        items[i], priorities[i] = item, priority
+        position[item] = i
+    
+    def _sift_down(self, i):
+        items, priorities, position = self.items, self.priorities, self.position
+        item, priority = items[i], priorities[i]
+        n = len(items)
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priority <= priorities[child]:
+                break
+            items[i], priorities[i] = items[child], priorities[child]
+            position[items[i]] = i
+            i = child
+        items[i], priorities[i] = item, priority
+        position[item] = i
+
+
+def _dijkstra(adjacency, sources, pq=None):
+    """
+    Multi-source Dijkstra over a weighted adjacency dict: distance from
+    each vertex to its nearest source. Uses decrease_key on an
+    IndexedPriorityQueue (pq: an empty one to use instead of a fresh
+    one), so the queue holds at most V entries
+    """
+    distances = {v: float('inf') for v in adjacency}
+    if pq is None:
+        pq = IndexedPriorityQueue()
+    for source in sources:
+        if source not in pq:
+            distances[source] = 0
+            pq.push(source, 0)
+    
+    while pq:
+        curr, curr_dist = pq.pop()
+        
+        for neighbor, weight in adjacency[curr]:
+            distance = curr_dist + weight
+            
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                if neighbor in pq:
+                    pq.decrease_key(neighbor, distance)
+                else:
+                    pq.push(neighbor, distance)
+    
+    return distances
+
+
+# Adjacency handed to each all_pairs() worker process once, at start-up
+_worker_adjacency = None
+
+
+def _init_dijkstra_worker(adjacency):
+    global _worker_adjacency
+    _worker_adjacency = adjacency
+
+
+def _dijkstra_worker(source):
+    return source, _dijkstra(_worker_adjacency, (source,))
 
 
 class WeightedGraph(Graph):
@@ -91,9 +236,15 @@ class WeightedGraph(Graph):
     
     def __init__(self):
         self.graph = {}
+        # source -> distances, cleared whenever an edge is added
+        self.distance_cache = {}
+        # Reversed adjacency for backward searches; only needed (and
+        # built on demand) once add_directed_edge has been used
+        self.directed = False
+        self.incoming_cache = None
     
     def add_edge(self, v1, v2, weight):
-        """Add weighted undirected edge"""
+        """Add weighted undirected edge (invalidates cached distances)"""
         if v1 not in self.graph:
             self.graph[v1] = []
         if v2 not in self.graph:
@@ -101,27 +252,600 @@ class WeightedGraph(Graph):
         
         self.graph[v1].append((v2, weight))
         self.graph[v2].append((v1, weight))
+        self._edges_changed()
+    
+    def add_directed_edge(self, v1, v2, weight):
+        """Add weighted directed edge (invalidates cached distances)"""
+        if v1 not in self.graph:
+            self.graph[v1] = []
+        if v2 not in self.graph:
+            self.graph[v2] = []
+        self.graph[v1].append((v2, weight))
+        self.directed = True
+        self._edges_changed()
+    
+    def _edges_changed(self):
+        self.distance_cache.clear()
+        self.incoming_cache = None
     
     def dijkstra(self, start):
-        """Dijkstra's shortest path - O((V + E) log V)"""
-        distances = {v: float('inf') for v in self.graph}
-        distances[start] = 0
-        pq = [(0, start)]
+        """
+        Dijkstra's shortest path - O((V + E) log V) on the first call
+        from start, then answered from the distance cache (as a copy)
+        until an edge is added
+        """
+        if start not in self.distance_cache:
+            self.distance_cache[start] = _dijkstra(self.graph, (start,))
+        return dict(self.distance_cache[start])
+    
+    def multi_source_dijkstra(self, sources):
+        """Distance from every vertex to its nearest source - one O((V + E) log V) pass"""
+        return _dijkstra(self.graph, sources)
+    
+    def all_pairs(self, method='dijkstra', workers=None):
+        """
+        All-pairs shortest distances as {source: {target: distance}}.
+        - 'dijkstra': one Dijkstra per vertex - O(V (V + E) log V); with
+          workers > 1 the sources are spread over a process pool
+        - 'floyd': Floyd-Warshall - O(V^3), fine for small dense graphs
+        Every row is stored in the distance cache
+        """
+        if method == 'floyd':
+            rows = self._floyd_warshall()
+        elif method != 'dijkstra':
+            raise ValueError(f"method must be 'dijkstra' or 'floyd', not {method!r}")
+        elif workers and workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(workers, initializer=_init_dijkstra_worker,
+                                     initargs=(self.graph,)) as pool:
+                rows = dict(pool.map(_dijkstra_worker, self.graph,
+                                     chunksize=max(1, len(self.graph) // (4 * workers))))
+        else:
+            rows = {source: _dijkstra(self.graph, (source,)) for source in self.graph}
+        
+        self.distance_cache.update(rows)
+        return {source: dict(row) for source, row in rows.items()}
+    
+    def _floyd_warshall(self):
+        vertices = list(self.graph)
+        index = {v: i for i, v in enumerate(vertices)}
+        n = len(vertices)
+        dist = [[float('inf')] * n for _ in range(n)]
+        for v, edges in self.graph.items():
+            row = dist[index[v]]
+            row[index[v]] = 0
+            for neighbor, weight in edges:
+                j = index[neighbor]
+                if weight < row[j]:
+                    row[j] = weight
+        
+        for k in range(n):
+            row_k = dist[k]
+            for row_i in dist:
+                through_k = row_i[k]
+                if through_k == float('inf'):
+                    continue
+                for j in range(n):
+                    distance = through_k + row_k[j]
+                    if distance < row_i[j]:
+                        row_i[j] = distance
+        
+        return {v: dict(zip(vertices, dist[index[v]])) for v in vertices}
+    
+    @staticmethod
+    def _path_to(previous, vertex):
+        """Walk predecessor links back from vertex; return start -> vertex"""
+        path = []
+        while vertex is not None:
+            path.append(vertex)
+            vertex = previous[vertex]
+        return path[::-1]
+    
+    def astar(self, start, end, heuristic):
+        """
+        A* search: Dijkstra ordered by distance + heuristic(vertex, end).
+        With an admissible heuristic (never overestimates) the result is
+        optimal; returns (distance, path), or (inf, []) if unreachable
+        """
+        distances = {start: 0}
+        previous = {start: None}
+        pq = [(heuristic(start, end), 0, start)]
         
         while pq:
-            curr_dist, curr = heapq.heappop(pq)
+            _, curr_dist, curr = heapq.heappop(pq)
             
             if curr_dist > distances[curr]:
                 continue
+            if curr == end:
+                return curr_dist, self._path_to(previous, end)
             
             for neighbor, weight in self.graph[curr]:
                 distance = curr_dist + weight
                 
+                if distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = distance
+                    previous[neighbor] = curr
+                    heapq.heappush(pq, (distance + heuristic(neighbor, end),
+                                        distance, neighbor))
+        
+        return float('inf'), []
+    
+    def shortest_path(self, start, end):
+        """Point-to-point Dijkstra: stops once end is settled; (distance, path)"""
+        return self.astar(start, end, lambda vertex, goal: 0)
+    
+    def _incoming(self):
+        """vertex -> [(predecessor, weight), ...]: every edge reversed - O(V + E)"""
+        incoming = {v: [] for v in self.graph}
+        for v, edges in self.graph.items():
+            for neighbor, weight in edges:
+                incoming[neighbor].append((v, weight))
+        return incoming
+    
+    def _bidirectional_search(self, start, end, incoming):
+        """
+        Search forward from start over outgoing edges and backward from
+        end over incoming ones, stopping when the two frontiers can no
+        longer improve the best meeting point
+        """
+        adjacency = (self.graph, incoming)
+        distances = ({start: 0}, {end: 0})
+        previous = ({start: None}, {end: None})
+        queues = ([(0, start)], [(0, end)])
+        best, meeting = float('inf'), None
+        
+        while queues[0] and queues[1]:
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+            side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+            dist, prev, other = distances[side], previous[side], distances[1 - side]
+            
+            curr_dist, curr = heapq.heappop(queues[side])
+            if curr_dist > dist[curr]:
+                continue
+            
+            for neighbor, weight in adjacency[side][curr]:
+                distance = curr_dist + weight
+                
+                if distance < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = distance
+                    prev[neighbor] = curr
+                    heapq.heappush(queues[side], (distance, neighbor))
+                if neighbor in other and dist[neighbor] + other[neighbor] < best:
+                    best = dist[neighbor] + other[neighbor]
+                    meeting = neighbor
+        
+        if meeting is None:
+            return float('inf'), []
+        forward = self._path_to(previous[0], meeting)
+        backward = self._path_to(previous[1], meeting)
+        return best, forward + backward[-2::-1]
+    
+    def bidirectional_dijkstra(self, start, end):
+        """
+        Point-to-point Dijkstra run from both ends at once. The search
+        from end follows edges backwards: on an undirected graph that is
+        the adjacency list itself, otherwise a reversed copy that is
+        built once and reused until an edge is added.
+        Returns (distance, path), or (inf, []) if unreachable
+        """
+        if start == end and start in self.graph:
+            return 0, [start]
+        
+        incoming = self.graph
+        if self.directed:
+            if self.incoming_cache is None:
+                self.incoming_cache = self._incoming()
+            incoming = self.incoming_cache
+        return self._bidirectional_search(start, end, incoming)
+    
+    def freeze(self):
+        """Immutable CSR snapshot with a parallel weight array - O(V + E)"""
+        return FrozenGraph.from_adjacency(self.graph, weighted=True)
+
+
+# CSR arrays (and the parallel_bfs visited bitmap) each FrozenGraph
+# worker process attaches to once, at start-up
+_worker_csr = None
+
+
+def _attach_csr_worker(blocks):
+    """Map the parent's shared-memory offsets / targets / visited blocks"""
+    global _worker_csr
+    from multiprocessing import shared_memory
+    attached = [shared_memory.SharedMemory(name=name) for name, _, _ in blocks]
+    views = [shm.buf[:nbytes].cast(typecode)
+             for shm, (_, typecode, nbytes) in zip(attached, blocks)]
+    _worker_csr = attached, *views
+
+
+# Per-worker scratch bitmap: ids already returned by the current shard
+_worker_found = None
+
+
+def _expand_frontier(frontier):
+    """
+    Unvisited neighbor ids of one frontier shard, deduplicated. The
+    visited bitmap only changes between levels, so it is safe to read
+    """
+    global _worker_found
+    _, offsets, targets, visited = _worker_csr
+    if _worker_found is None:
+        _worker_found = bytearray(len(visited))
+    found = _worker_found
+    result = array('q')
+    for v in frontier:
+        for neighbor in targets[offsets[v]:offsets[v + 1]]:
+            if not visited[neighbor] and not found[neighbor]:
+                found[neighbor] = 1
+                result.append(neighbor)
+    for neighbor in result:
+        found[neighbor] = 0
+    return result
+
+
+def _reach_from(job):
+    """Ids reachable from one source within max_depth hops (BFS order)"""
+    source, max_depth = job
+    _, offsets, targets, _ = _worker_csr
+    visited = {source}
+    order = array('q', [source])
+    frontier = [source]
+    depth = 0
+    
+    while frontier and (max_depth is None or depth < max_depth):
+        next_frontier = []
+        for v in frontier:
+            for neighbor in targets[offsets[v]:offsets[v + 1]]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    next_frontier.append(neighbor)
+        order.extend(next_frontier)
+        frontier = next_frontier
+        depth += 1
+    return order
+
+
+class FrozenGraph:
+    """
+    Immutable CSR (Compressed Sparse Row) snapshot of a Graph
+    - vertices: vertex labels; vertex id = position in this list
+    - offsets: targets[offsets[v]:offsets[v + 1]] are v's neighbor ids
+    - weights: parallel to targets (WeightedGraph only)
+    Edges cost a 4-8 byte id (+ 8 byte weight) in flat arrays instead of
+    a list slot pointing at a label or a (neighbor, weight) tuple.
+    Create with Graph.freeze() / WeightedGraph.freeze().
+    """
+    
+    def __init__(self, vertices, offsets, targets, weights=None):
+        self.vertices = vertices
+        self.index = {v: i for i, v in enumerate(vertices)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+    
+    @classmethod
+    def from_adjacency(cls, adjacency, weighted=False):
+        """Build from {vertex: [neighbor, ...]} or {vertex: [(neighbor, weight), ...]}"""
+        vertices = list(adjacency)
+        index = {v: i for i, v in enumerate(vertices)}
+        typecode = 'i' if len(vertices) < 2**31 else 'q'
+        offsets = array('q', [0])
+        targets = array(typecode)
+        weights = array('d') if weighted else None
+        
+        for v in vertices:
+            if weighted:
+                for neighbor, weight in adjacency[v]:
+                    targets.append(index[neighbor])
+                    weights.append(weight)
+            else:
+                targets.extend(index[neighbor] for neighbor in adjacency[v])
+            offsets.append(len(targets))
+        return cls(vertices, offsets, targets, weights)
+    
+    def __len__(self):
+        return len(self.vertices)
+    
+    def edge_count(self):
+        """Number of stored (directed) adjacency entries"""
+        return len(self.targets)
+    
+    def neighbors(self, vertex):
+        """Neighbor labels of vertex"""
+        v = self.index[vertex]
+        labels = self.vertices
+        return [labels[t] for t in self.targets[self.offsets[v]:self.offsets[v + 1]]]
+    
+    def memory_usage(self):
+        """Bytes used by the CSR arrays (excluding the vertex labels)"""
+        total = sys.getsizeof(self.offsets) + sys.getsizeof(self.targets)
+        if self.weights is not None:
+            total += sys.getsizeof(self.weights)
+        return total
+    
+    def iter_bfs(self, start):
+        """Lazy Breadth-First Search over vertex ids"""
+        offsets, targets, labels = self.offsets, self.targets, self.vertices
+        source = self.index[start]
+        visited = bytearray(len(labels))
+        visited[source] = 1
+        queue = deque([source])
+        
+        while queue:
+            node = queue.popleft()
+            yield labels[node]
+            for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+    
+    def bfs(self, start):
+        """Breadth-First Search - O(V + E)"""
+        return list(self.iter_bfs(start))
+    
+    def iter_dfs(self, start):
+        """Lazy Depth-First Search (same order as Graph.iter_dfs)"""
+        offsets, targets, labels = self.offsets, self.targets, self.vertices
+        source = self.index[start]
+        visited = bytearray(len(labels))
+        visited[source] = 1
+        yield start
+        stack = [iter(targets[offsets[source]:offsets[source + 1]])]
+        
+        while stack:
+            for neighbor in stack[-1]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    yield labels[neighbor]
+                    stack.append(iter(targets[offsets[neighbor]:offsets[neighbor + 1]]))
+                    break
+            else:
+                stack.pop()
+    
+    def dfs(self, start):
+        """Depth-First Search - O(V + E)"""
+        return list(self.iter_dfs(start))
+    
+    def has_path(self, start, end):
+        """Check if path exists (stops as soon as end is reached)"""
+        return any(node == end for node in self.iter_dfs(start))
+    
+    def dijkstra(self, start):
+        """
+        Dijkstra's shortest path over the CSR arrays - O((V + E) log V).
+        Vertex ids go through an IndexedPriorityQueue (decrease_key), so
+        the queue holds at most V entries
+        """
+        if self.weights is None:
+            raise TypeError("dijkstra() needs a graph frozen from a WeightedGraph")
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        distances = [float('inf')] * len(self.vertices)
+        source = self.index[start]
+        distances[source] = 0
+        pq = IndexedPriorityQueue()
+        pq.push(source, 0)
+        
+        while pq:
+            curr, curr_dist = pq.pop()
+            
+            for i in range(offsets[curr], offsets[curr + 1]):
+                neighbor = targets[i]
+                distance = curr_dist + weights[i]
+                
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    if neighbor in pq:
+                        pq.decrease_key(neighbor, distance)
+                    else:
+                        pq.push(neighbor, distance)
+        
+        return dict(zip(self.vertices, distances))
+    
+    @contextmanager
+    def _worker_pool(self, workers):
+        """
+        Process pool whose workers map offsets / targets from shared
+        memory instead of each unpickling a copy of the graph. Yields
+        (pool, visited): a zeroed one-byte-per-vertex bitmap, also
+        shared, that the parent writes and the workers read
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+        
+        arrays = (self.offsets, self.targets, array('B', bytes(len(self.vertices))))
+        blocks, visited = [], None
+        try:
+            for data in arrays:
+                raw = memoryview(data).cast('B')
+                # SharedMemory refuses size 0 (a graph with no edges)
+                shm = shared_memory.SharedMemory(create=True, size=max(raw.nbytes, 1))
+                shm.buf[:raw.nbytes] = raw
+                blocks.append(shm)
+            layout = [(shm.name, data.typecode, len(data) * data.itemsize)
+                      for shm, data in zip(blocks, arrays)]
+            visited = blocks[2].buf[:len(self.vertices)]
+            with ProcessPoolExecutor(workers, initializer=_attach_csr_worker,
+                                     initargs=(layout,)) as pool:
+                yield pool, visited
+        finally:
+            if visited is not None:
+                visited.release()
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+    
+    def parallel_bfs(self, start, workers=None):
+        """
+        Level-synchronous BFS: each level's frontier is split into one
+        shard per worker, and the shards are expanded in parallel over
+        the shared CSR arrays and visited bitmap. Workers return only
+        unvisited vertices, so the parent just merges shards that found
+        the same vertex and marks the next level visited.
+        Returns the levels as lists of labels: [[start], [dist 1], ...]
+        """
+        workers = workers or os.cpu_count() or 1
+        source = self.index[start]
+        frontier = [source]
+        levels = []
+        
+        with self._worker_pool(workers) as (pool, visited):
+            visited[source] = 1
+            while frontier:
+                levels.append([self.vertices[v] for v in frontier])
+                size = -(-len(frontier) // workers)
+                shards = [frontier[i:i + size] for i in range(0, len(frontier), size)]
+                next_frontier = []
+                for found in pool.map(_expand_frontier, shards):
+                    for v in found:
+                        if not visited[v]:
+                            visited[v] = 1
+                            next_frontier.append(v)
+                frontier = next_frontier
+        return levels
+    
+    def multi_source_reach(self, sources, max_depth=None, workers=None):
+        """
+        Independent BFS from every source, spread over a process pool:
+        {source: labels reachable within max_depth hops (all if None)}.
+        Each run is O(V + E) at worst, so many seeds keep every core busy
+        """
+        workers = workers or os.cpu_count() or 1
+        sources = list(sources)
+        jobs = [(self.index[source], max_depth) for source in sources]
+        chunksize = max(1, len(jobs) // (4 * workers))
+        labels = self.vertices
+        
+        with self._worker_pool(workers) as (pool, _):
+            reached = pool.map(_reach_from, jobs, chunksize=chunksize)
+            return {source: [labels[v] for v in ids]
+                    for source, ids in zip(sources, reached)}
+
+
+def benchmark_freeze(vertices=100_000, edges=1_000_000):
+    """Memory and BFS time: adjacency-list Graph vs its frozen CSR form"""
+    import random
+    import tracemalloc
+    from time import perf_counter
+    
+    tracemalloc.start()
+    g = Graph()
+    for _ in range(edges):
+        g.add_edge(random.randrange(vertices), random.randrange(vertices))
+    adjacency_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    
+    tracemalloc.start()
+    frozen = g.freeze()
+    frozen_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    
+    start_vertex = next(iter(g.graph))
+    for label, graph in (("adjacency list", g), ("frozen CSR", frozen)):
+        start = perf_counter()
+        graph.bfs(start_vertex)
+        bfs_ms = (perf_counter() - start) * 1000
+        memory = adjacency_mb if graph is g else frozen_mb
+        print(f"{label:15} {memory:8.1f} MB   BFS {bfs_ms:8.1f} ms")
+
+
+def benchmark_priority_queue(vertices=2_000, edges=200_000):
+    """Peak queue size and Dijkstra time: heapq lazy deletion vs decrease_key"""
+    import random
+    from time import perf_counter
+    
+    wg = WeightedGraph()
+    for _ in range(edges):
+        wg.add_edge(random.randrange(vertices), random.randrange(vertices),
+                    random.randint(1, 1000))
+    start_vertex = next(iter(wg.graph))
+    
+    def lazy_deletion():
+        distances = {v: float('inf') for v in wg.graph}
+        distances[start_vertex] = 0
+        pq = [(0, start_vertex)]
+        peak = 1
+        
+        while pq:
+            curr_dist, curr = heapq.heappop(pq)
+            if curr_dist > distances[curr]:
+                continue
+            for neighbor, weight in wg.graph[curr]:
+                distance = curr_dist + weight
                 if distance < distances[neighbor]:
                     distances[neighbor] = distance
                     heapq.heappush(pq, (distance, neighbor))
+            peak = max(peak, len(pq))
+        return distances, peak
+    
+    class PeakQueue(IndexedPriorityQueue):
+        peak = 0
         
-        return distances
+        def push(self, item, priority):
+            super().push(item, priority)
+            self.peak = max(self.peak, len(self))
+    
+    start = perf_counter()
+    lazy_distances, lazy_peak = lazy_deletion()
+    lazy_ms = (perf_counter() - start) * 1000
+    
+    # The production Dijkstra: timed as-is, peak taken from a second,
+    # instrumented run so the bookkeeping does not skew the timing
+    start = perf_counter()
+    indexed_distances = _dijkstra(wg.graph, (start_vertex,))
+    indexed_ms = (perf_counter() - start) * 1000
+    pq = PeakQueue()
+    _dijkstra(wg.graph, (start_vertex,), pq)
+    
+    print(f"{'heapq lazy deletion':21} peak queue {lazy_peak:8}   {lazy_ms:8.1f} ms")
+    print(f"{'indexed decrease_key':21} peak queue {pq.peak:8}   {indexed_ms:8.1f} ms")
+    print(f"Same distances: {lazy_distances == indexed_distances}")
+
+
+def benchmark_distance_cache(vertices=5_000, edges=25_000, hubs=5, queries=50):
+    """Repeated hub queries: recomputing Dijkstra vs the per-source cache"""
+    import random
+    from time import perf_counter
+    
+    wg = WeightedGraph()
+    for _ in range(edges):
+        wg.add_edge(random.randrange(vertices), random.randrange(vertices),
+                    random.randint(1, 1000))
+    hub_vertices = random.sample(list(wg.graph), hubs)
+    requests = [random.choice(hub_vertices) for _ in range(queries)]
+    
+    start = perf_counter()
+    for source in requests:
+        _dijkstra(wg.graph, (source,))
+    uncached = perf_counter() - start
+    
+    start = perf_counter()
+    for source in requests:
+        wg.dijkstra(source)
+    cached = perf_counter() - start
+    
+    print(f"{queries} queries from {hubs} hubs: recompute {uncached * 1000:8.1f} ms, "
+          f"cached {cached * 1000:8.1f} ms")
+
+
+def benchmark_parallel_reach(vertices=50_000, edges=250_000, seeds=10_000, max_depth=2):
+    """Reachability for many seeds: one process vs a shared-memory pool"""
+    import random
+    from time import perf_counter
+    
+    g = Graph()
+    for _ in range(edges):
+        g.add_directed_edge(random.randrange(vertices), random.randrange(vertices))
+    frozen = g.freeze()
+    sources = random.sample(list(g.graph), min(seeds, len(g.graph)))
+    
+    results = []
+    for workers in (1, max(2, os.cpu_count() or 1)):
+        start = perf_counter()
+        results.append(frozen.multi_source_reach(sources, max_depth, workers))
+        elapsed_ms = (perf_counter() - start) * 1000
+        print(f"{len(sources)} seeds, {workers:2} worker(s): {elapsed_ms:8.1f} ms")
+    print(f"Same reachable sets: {results[0] == results[-1]}")
 
 
 # ==========================================
@@ -207,6 +931,31 @@ if __name__ == "__main__":
     for city in sorted(distances.keys()):
         print(f"  To {city}: {distances[city]} km")
     
+    print(f"\nshortest_path(A, E): {wg.shortest_path('A', 'E')}")
+    print(f"bidirectional_dijkstra(A, E): {wg.bidirectional_dijkstra('A', 'E')}")
+    # Straight-line km from each city to E (never more than the road distance)
+    to_e = {'A': 10, 'B': 6, 'C': 9, 'D': 2, 'E': 0}
+    print(f"astar(A, E): {wg.astar('A', 'E', lambda city, goal: to_e[city])}")
+    
+    frozen = wg.freeze()
+    print(f"\nFrozen CSR form: {len(frozen)} vertices, {frozen.edge_count()} "
+          f"adjacency entries, {frozen.memory_usage()} bytes of arrays")
+    print(f"CSR Dijkstra from A matches: {frozen.dijkstra('A') == distances}")
+    print(f"CSR BFS from A: {frozen.bfs('A')}")
+    print("\nAdjacency list vs CSR (20,000 vertices, 200,000 edges):")
+    benchmark_freeze(vertices=20_000, edges=200_000)
+    print("\nDijkstra priority queue (2,000 vertices, 200,000 edges):")
+    benchmark_priority_queue()
+    
+    print(f"\nNearest of depots C, E: {wg.multi_source_dijkstra(['C', 'E'])}")
+    print(f"All pairs (Floyd-Warshall) matches Dijkstra: "
+          f"{wg.all_pairs('floyd') == wg.all_pairs('dijkstra', workers=2)}")
+    print(f"Cached sources: {sorted(wg.distance_cache)}")
+    wg.add_edge("A", "E", 9)
+    print(f"After add_edge(A, E, 9): cached sources {sorted(wg.distance_cache)}, "
+          f"A->E {wg.dijkstra('A')['E']} km")
+    print("\nDistance cache (5,000 vertices, 25,000 edges):")
+    benchmark_distance_cache()
     print("\n" + "="*50)
     print("3. SOCIAL NETWORK")
     print("="*50)
@@ -220,7 +969,16 @@ if __name__ == "__main__":
     print("="*50)
     
     crawl = web_crawler()
-    print(f"\nPages crawled from PageA: {' -> '.join(crawl)}\n")
+    print(f"\nPages crawled from PageA: {' -> '.join(crawl)}")
+    
+    web = Graph()
+    for p1, p2 in [("PageA", "PageB"), ("PageA", "PageC"),
+                   ("PageB", "PageC"), ("PageB", "PageD")]:
+        web.add_directed_edge(p1, p2)
+    print(f"Crawl levels (parallel frontier BFS): {web.freeze().parallel_bfs('PageA', workers=2)}")
+    print("\nMany-source reachability within 2 hops:")
+    benchmark_parallel_reach()
+    print()
     
     print("="*50)
     print("APPLICATIONS:")
@@ -3,63 +3,117 @@ SIMPLE REAL-WORLD APPLICATION: SHOPPING CART SYSTEM
 Using Singly Linked List to manage items dynamically
 """
 
+import sys
+from array import array
+from decimal import Decimal
+
+
 class Node:
+    # __slots__ drops the per-instance __dict__ (roughly halves node size)
+    __slots__ = ('item_name', 'price', 'quantity', 'next', 'prev')
+    
     def __init__(self, item_name, price, quantity=1):
         self.item_name = item_name
         self.price = price
         self.quantity = quantity
         self.next = None
+        self.prev = None  # only linked when the cart is doubly linked
 
 
-class ShoppingCart:
+class _CartBase:
     """
-    Shopping Cart using Singly Linked List
-    
-    Why Linked List for Shopping Cart?
-    - Dynamic size: Add/remove items without pre-allocating space
-    - Efficient insertion/deletion: O(1) at beginning, O(n) at specific position
-    - No shifting required when adding/removing items (unlike arrays)
-    - Memory efficient for varying cart sizes
+    Cart logic shared by ShoppingCart and PooledShoppingCart: name
+    index, running totals, add/remove/update and display. Subclasses
+    store the line items and provide the node hooks (_new_node,
+    _drop_node, _iter_nodes, _node_fields, _store_quantity); a node is
+    whatever handle those hooks hand out.
     """
     
-    def __init__(self):
-        self.head = None
+    def __init__(self, indexed=True, exact=False):
         self.item_count = 0
+        self.unit_count = 0
+        self.exact = exact
+        self.total = Decimal(0) if exact else 0
+        self.indexed = indexed
+        self.index = {}
     
-    def add_item(self, item_name, price, quantity=1):
-        """Add item to cart"""
-        new_node = Node(item_name, price, quantity)
+    def _index_add(self, node, item_name):
+        if self.indexed:
+            self.index.setdefault(item_name, []).append(node)
+    
+    def _index_remove(self, node, item_name):
+        if self.indexed:
+            nodes = self.index[item_name]
+            nodes.remove(node)
+            if not nodes:
+                del self.index[item_name]
+    
+    def find_item(self, item_name):
+        """Return the first node named item_name, or None"""
+        if self.indexed:
+            nodes = self.index.get(item_name)
+            return nodes[0] if nodes else None
         
-        if not self.head:
-            self.head = new_node
-        else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+        for node in self._iter_nodes():
+            if self._node_fields(node)[0] == item_name:
+                return node
+        return None
+    
+    def __contains__(self, item_name):
+        return self.find_item(item_name) is not None
+    
+    def index_memory(self):
+        """Bytes used by the name index (0 when not indexed)"""
+        if not self.indexed:
+            return 0
+        return sys.getsizeof(self.index) + sum(
+            sys.getsizeof(nodes) for nodes in self.index.values())
+    
+    def _append(self, item_name, price, quantity):
+        """Link a new node after the tail - O(1)"""
+        if self.exact:
+            price = Decimal(str(price))
+        node = self._new_node(item_name, price, quantity)
         
+        self._index_add(node, item_name)
         self.item_count += 1
+        self.unit_count += quantity
+        self.total += price * quantity
+        return node
+    
+    def add_item(self, item_name, price, quantity=1):
+        """Add item to cart - O(1) via the tail pointer"""
+        self._append(item_name, price, quantity)
         print(f"✓ Added {quantity}x {item_name} @ ${price}")
     
+    def import_items(self, items):
+        """Bulk-add (item_name, price, quantity) rows without per-item output"""
+        count = 0
+        for item_name, price, quantity in items:
+            self._append(item_name, price, quantity)
+            count += 1
+        print(f"✓ Imported {count} items")
+    
+    def _unlink(self, node):
+        item_name, price, quantity = self._node_fields(node)
+        self._index_remove(node, item_name)
+        self._drop_node(node)
+        self.item_count -= 1
+        self.unit_count -= quantity
+        self.total -= price * quantity
+        if not self.item_count:
+            # Reset so float rounding from past adds/removes cannot linger
+            self.total = Decimal(0) if self.exact else 0
+    
     def remove_item(self, item_name):
         """Remove item from cart"""
-        if not self.head:
+        if not self.item_count:
             print("Cart is empty!")
             return False
         
-        if self.head.item_name == item_name:
-            self.head = self.head.next
-            self.item_count -= 1
-            print(f"✓ Removed {item_name}")
-            return True
-        
-        current = self.head
-        while current.next and current.next.item_name != item_name:
-            current = current.next
-        
-        if current.next:
-            current.next = current.next.next
-            self.item_count -= 1
+        node = self.find_item(item_name)
+        if node is not None:
+            self._unlink(node)
             print(f"✓ Removed {item_name}")
             return True
         
@@ -68,30 +122,41 @@ class ShoppingCart:
     
     def update_quantity(self, item_name, new_quantity):
         """Update quantity of existing item"""
-        current = self.head
+        node = self.find_item(item_name)
         
-        while current:
-            if current.item_name == item_name:
-                current.quantity = new_quantity
-                print(f"✓ Updated {item_name} quantity to {new_quantity}")
-                return True
-            current = current.next
+        if node is not None:
+            self._set_quantity(node, new_quantity)
+            print(f"✓ Updated {item_name} quantity to {new_quantity}")
+            return True
         
         print(f"✗ Item not found")
         return False
     
+    def _set_quantity(self, node, new_quantity):
+        _, price, quantity = self._node_fields(node)
+        self.unit_count += new_quantity - quantity
+        self.total += price * (new_quantity - quantity)
+        self._store_quantity(node, new_quantity)
+    
     def calculate_total(self):
-        """Calculate total price"""
-        total = 0
-        current = self.head
-        while current:
-            total += current.price * current.quantity
-            current = current.next
+        """Total price - O(1), maintained as the cart changes"""
+        return self.total
+    
+    def recalculate_total(self):
+        """Recompute total and unit count with a full walk (O(n) check)"""
+        total = Decimal(0) if self.exact else 0
+        units = 0
+        for node in self._iter_nodes():
+            _, price, quantity = self._node_fields(node)
+            total += price * quantity
+            units += quantity
+        self.total = total
+        self.unit_count = units
         return total
     
     def display_cart(self):
         """Display all items in cart"""
-        if not self.head:
+        if not self.item_count:
             print("\n🛒 Your cart is empty!\n")
             return
         
@@ -99,21 +164,265 @@ class ShoppingCart:
         print("🛒 SHOPPING CART")
         print("="*60)
         
+        for position, node in enumerate(self._iter_nodes(), 1):
+            item_name, price, quantity = self._node_fields(node)
+            print(f"{position}. {item_name:20} | "
+                  f"${price:6.2f} x {quantity:2} = "
+                  f"${price * quantity:7.2f}")
+        
+        print("-"*60)
+        print(f"{'ITEMS':42} {self.unit_count:8}")
+        print(f"{'TOTAL':42} ${self.total:7.2f}")
+        print("="*60 + "\n")
+
+
+class ShoppingCart(_CartBase):
+    """
+    Shopping Cart using Singly Linked List
+    
+    Why Linked List for Shopping Cart?
+    - Dynamic size: Add/remove items without pre-allocating space
+    - Efficient insertion/deletion: O(1) at beginning, O(n) at specific position
+    - No shifting required when adding/removing items (unlike arrays)
+    - Memory efficient for varying cart sizes
+    
+    A tail pointer makes add_item O(1), and an item_name -> nodes hash
+    index (on by default, indexed=False to save memory) makes lookups
+    O(1). With doubly_linked=True each node also points back to its
+    predecessor, so remove_item unlinks in O(1) instead of walking to
+    the previous node.
+    
+    The total and the unit count are kept up to date on every add,
+    remove and quantity change, so calculate_total() is O(1). Pass
+    exact=True to store prices as Decimal so money totals never drift.
+    """
+    
+    def __init__(self, indexed=True, doubly_linked=False, exact=False):
+        super().__init__(indexed, exact)
+        self.head = None
+        self.tail = None
+        self.doubly_linked = doubly_linked
+    
+    def _new_node(self, item_name, price, quantity):
+        new_node = Node(item_name, price, quantity)
+        
+        if not self.head:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+            if self.doubly_linked:
+                new_node.prev = self.tail
+        self.tail = new_node
+        return new_node
+    
+    def _predecessor(self, node):
+        """Node before node (None for head) - O(1) if doubly linked"""
+        if self.doubly_linked or node is self.head:
+            return node.prev
         current = self.head
-        position = 1
+        while current.next is not node:
+            current = current.next
+        return current
+    
+    def _drop_node(self, node):
+        prev = self._predecessor(node)
         
+        if prev:
+            prev.next = node.next
+        else:
+            self.head = node.next
+        
+        if node.next:
+            if self.doubly_linked:
+                node.next.prev = prev
+        else:
+            self.tail = prev
+    
+    def _iter_nodes(self):
+        current = self.head
         while current:
-            item_total = current.price * current.quantity
-            print(f"{position}. {current.item_name:20} | "
-                  f"${current.price:6.2f} x {current.quantity:2} = "
-                  f"${item_total:7.2f}")
+            yield current
             current = current.next
-            position += 1
+    
+    def _node_fields(self, node):
+        return node.item_name, node.price, node.quantity
+    
+    def _store_quantity(self, node, quantity):
+        node.quantity = quantity
+
+
+class NodePool:
+    """
+    Struct-of-arrays linked list: a node is an integer index into
+    parallel arrays instead of a Python object.
+    - item_names / prices: plain lists (any object)
+    - quantities / next / prev links: compact int64 arrays (-1 = None)
+    Freed slots go on a free list and are reused by the next append.
+    """
+    
+    NIL = -1
+    
+    def __init__(self):
+        self.item_names = []
+        self.prices = []
+        self.quantities = array('q')
+        self.next = array('q')
+        self.prev = array('q')
+        self.free = []
+        self.head = self.NIL
+        self.tail = self.NIL
+        self.length = 0
+    
+    def _alloc(self, item_name, price, quantity):
+        if self.free:
+            node = self.free.pop()
+            self.item_names[node] = item_name
+            self.prices[node] = price
+            self.quantities[node] = quantity
+        else:
+            node = len(self.item_names)
+            self.item_names.append(item_name)
+            self.prices.append(price)
+            self.quantities.append(quantity)
+            self.next.append(self.NIL)
+            self.prev.append(self.NIL)
+        self.next[node] = self.prev[node] = self.NIL
+        return node
+    
+    def append(self, item_name, price, quantity=1):
+        """Link a new node at the tail and return its index - O(1)"""
+        node = self._alloc(item_name, price, quantity)
+        if self.head == self.NIL:
+            self.head = node
+        else:
+            self.next[self.tail] = node
+            self.prev[node] = self.tail
+        self.tail = node
+        self.length += 1
+        return node
+    
+    def remove(self, node):
+        """Unlink node and put its slot on the free list - O(1)"""
+        before, after = self.prev[node], self.next[node]
+        if before == self.NIL:
+            self.head = after
+        else:
+            self.next[before] = after
+        if after == self.NIL:
+            self.tail = before
+        else:
+            self.prev[after] = before
+        self.item_names[node] = self.prices[node] = None
+        self.free.append(node)
+        self.length -= 1
+    
+    def __iter__(self):
+        """Yield (item_name, price, quantity) from head to tail"""
+        node = self.head
+        while node != self.NIL:
+            yield self.item_names[node], self.prices[node], self.quantities[node]
+            node = self.next[node]
+    
+    def __len__(self):
+        return self.length
+
+
+class PooledShoppingCart(_CartBase):
+    """
+    ShoppingCart whose line items live in a NodePool instead of Node
+    objects: a node is a pool index, and since the pool is doubly
+    linked removal is always O(1). Takes the same indexed / exact
+    options; head and tail are pool indices (NodePool.NIL when empty)
+    """
+    
+    def __init__(self, indexed=True, exact=False):
+        super().__init__(indexed, exact)
+        self.pool = NodePool()
+    
+    @property
+    def head(self):
+        return self.pool.head
+    
+    @property
+    def tail(self):
+        return self.pool.tail
+    
+    def _new_node(self, item_name, price, quantity):
+        return self.pool.append(item_name, price, quantity)
+    
+    def _drop_node(self, node):
+        self.pool.remove(node)
+    
+    def _iter_nodes(self):
+        pool, node = self.pool, self.pool.head
+        while node != NodePool.NIL:
+            yield node
+            node = pool.next[node]
+    
+    def _node_fields(self, node):
+        pool = self.pool
+        return pool.item_names[node], pool.prices[node], pool.quantities[node]
+    
+    def _store_quantity(self, node, quantity):
+        self.pool.quantities[node] = quantity
+
+
+def benchmark_node_memory(n=10**6):
+    """Bytes per cart node: __dict__ object vs __slots__ object vs NodePool"""
+    import tracemalloc
+    
+    # Same fields and __init__ as Node, but with a per-instance __dict__
+    DictNode = type('DictNode', (), {'__init__': Node.__init__})
+    
+    # Shared name/price objects so only node storage itself is measured
+    name, price = "SKU", 1.99
+    
+    def build_objects(node_class):
+        head = tail = node_class(name, price)
+        for _ in range(n - 1):
+            tail.next = node_class(name, price)
+            tail.next.prev = tail
+            tail = tail.next
+        return head
+    
+    def build_pool():
+        pool = NodePool()
+        for _ in range(n):
+            pool.append(name, price)
+        return pool
+    
+    for label, build in (("__dict__ node", lambda: build_objects(DictNode)),
+                         ("__slots__ node", lambda: build_objects(Node)),
+                         ("NodePool (SoA)", build_pool)):
+        tracemalloc.start()
+        kept = build()
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{label:16} {used / n:7.1f} bytes/node")
+        del kept
+
+
+def benchmark_bulk_import(n=50_000):
+    """Time importing, updating and removing n order lines"""
+    from time import perf_counter
+    
+    rows = [(f"SKU-{i}", 1.99, 1) for i in range(n)]
+    
+    for label, cart in (("Node objects", ShoppingCart(doubly_linked=True)),
+                        ("NodePool", PooledShoppingCart())):
+        start = perf_counter()
+        cart.import_items(rows)
+        imported = perf_counter() - start
         
-        print("-"*60)
-        total = self.calculate_total()
-        print(f"{'TOTAL':42} ${total:7.2f}")
-        print("="*60 + "\n")
+        start = perf_counter()
+        for i in range(0, n, 2):
+            node = cart.find_item(f"SKU-{i}")
+            cart._set_quantity(node, 3)
+            cart._unlink(node)
+        edited = perf_counter() - start
+        
+        print(f"{label}: import {n} lines: {imported * 1000:.1f} ms, "
+              f"update + remove {n // 2} lines by name: {edited * 1000:.1f} ms")
 
 
 # ============================================
@@ -125,7 +434,7 @@ if __name__ == "__main__":
     print("🛍️  SHOPPING CART SYSTEM - Using Linked Lists")
     print("="*60)
     
-    cart = ShoppingCart()
+    cart = ShoppingCart(doubly_linked=True, exact=True)
     
     # Add items
     print("\n--- Adding Items ---")
@@ -148,6 +457,32 @@ if __name__ == "__main__":
     
     cart.display_cart()
     
+    # Indexed lookups
+    print("--- Indexed Lookup ---")
+    print(f"'Monitor' in cart: {'Monitor' in cart}")
+    print(f"'Keyboard' in cart: {'Keyboard' in cart}")
+    print(f"Name index size: {cart.index_memory()} bytes\n")
+    
+    # Struct-of-arrays backend
+    print("--- Pooled Cart (NodePool backend) ---")
+    pooled = PooledShoppingCart(exact=True)
+    pooled.add_item("Laptop", 999.99, 1)
+    pooled.add_item("Mouse", 29.99, 2)
+    pooled.update_quantity("Mouse", 1)
+    pooled.remove_item("Laptop")
+    pooled.add_item("Monitor", 299.99, 1)  # reuses the freed slot
+    pooled.display_cart()
+    
+    # Bulk import
+    print("--- Bulk Import (tail pointer + name index) ---")
+    benchmark_bulk_import()
+    print()
+    
+    # Node storage
+    print("--- Memory per Node (100k nodes) ---")
+    benchmark_node_memory(10**5)
+    print()
+    
     # Show benefits
     print("="*60)
     print("WHY LINKED LISTS FOR SHOPPING CART?")
@@ -4,16 +4,188 @@ TREES - Hierarchical Non-Linear Data Structure (Simplified)
 Nodes connected in parent-child relationship (root to leaves)
 """
 
+import heapq
+import operator
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import deque
 
 class TreeNode:
     """Node for Binary Tree"""
+    __slots__ = ('data', 'left', 'right')
+    
     def __init__(self, data):
         self.data = data
         self.left = None
         self.right = None
 
 
+def _iter_inorder(node):
+    """Yield nodes Left -> Root -> Right with an explicit stack - O(h) memory"""
+    stack = []
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+def _iter_preorder(node):
+    """Yield nodes Root -> Left -> Right with an explicit stack"""
+    stack = [node] if node else []
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+
+def _iter_postorder(node):
+    """Yield nodes Left -> Right -> Root with an explicit stack"""
+    stack, last = [], None
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        if top.right and top.right is not last:
+            node = top.right
+        else:
+            last = stack.pop()
+            yield last
+
+
+def _depth(root):
+    """Tree height without recursion (works on degenerate trees)"""
+    depth, level = 0, [root] if root else []
+    while level:
+        depth += 1
+        level = [child for node in level for child in (node.left, node.right) if child]
+    return depth
+
+
+class _TreeWriter:
+    """
+    Buffered encoder for the compact tree format
+    Values are a tag byte + payload: ints as zigzag varints, floats as
+    8-byte doubles, strings as varint length + UTF-8, plus None/True/False.
+    """
+    
+    CHUNK = 1 << 16
+    
+    def __init__(self, fp):
+        self.fp = fp
+        self.buffer = bytearray()
+    
+    def varint(self, n):
+        buffer = self.buffer
+        while n > 0x7F:
+            buffer.append((n & 0x7F) | 0x80)
+            n >>= 7
+        buffer.append(n)
+    
+    def byte(self, b):
+        self.buffer.append(b)
+    
+    def value(self, value):
+        buffer = self.buffer
+        if value is None:
+            buffer += b'n'
+        elif value is True or value is False:
+            buffer += b'T' if value else b'F'
+        elif isinstance(value, int):
+            buffer += b'i'
+            self.varint(value << 1 if value >= 0 else (-value << 1) - 1)
+        elif isinstance(value, float):
+            buffer += b'f'
+            buffer += struct.pack('<d', value)
+        elif isinstance(value, str):
+            encoded = value.encode()
+            buffer += b's'
+            self.varint(len(encoded))
+            buffer += encoded
+        else:
+            raise TypeError(f"Cannot serialize {type(value).__name__} values")
+        if len(buffer) >= self.CHUNK:
+            self.flush()
+    
+    def flush(self):
+        self.fp.write(self.buffer)
+        self.buffer.clear()
+
+
+class _TreeReader:
+    """
+    Chunked decoder matching _TreeWriter. Reads ahead in 64KB chunks;
+    release() seeks back over the unused bytes so anything written after
+    the tree stays readable (unseekable streams lose the read-ahead)
+    """
+    
+    CHUNK = 1 << 16
+    
+    def __init__(self, fp):
+        self.fp = fp
+        self.data = b''
+        self.pos = 0
+    
+    def read(self, n):
+        if self.pos + n > len(self.data):
+            self.data = self.data[self.pos:] + self.fp.read(max(n, self.CHUNK))
+            self.pos = 0
+            if n > len(self.data):
+                raise EOFError("Truncated tree data")
+        chunk = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return chunk
+    
+    def byte(self):
+        if self.pos < len(self.data):
+            self.pos += 1
+            return self.data[self.pos - 1]
+        return self.read(1)[0]
+    
+    def varint(self):
+        result, shift = 0, 0
+        while True:
+            b = self.byte()
+            result |= (b & 0x7F) << shift
+            if b < 0x80:
+                return result
+            shift += 7
+    
+    def value(self):
+        tag = bytes((self.byte(),))
+        if tag == b'i':
+            z = self.varint()
+            return z >> 1 if not z & 1 else -((z + 1) >> 1)
+        if tag == b'f':
+            return struct.unpack('<d', self.read(8))[0]
+        if tag == b's':
+            return self.read(self.varint()).decode()
+        if tag == b'n':
+            return None
+        if tag in (b'T', b'F'):
+            return tag == b'T'
+        raise ValueError(f"Unknown value tag {tag!r}")
+    
+    def release(self):
+        unused = len(self.data) - self.pos
+        if unused and self.fp.seekable():
+            self.fp.seek(-unused, 1)
+        self.data, self.pos = b'', 0
+    
+    def header(self, magic):
+        if self.read(len(magic)) != magic:
+            raise ValueError("Not a serialized tree of this kind")
+        return self.varint()
+
+
 class BinaryTree:
     """Binary Tree: Each node has at most 2 children"""
     
@@ -21,7 +193,7 @@ class BinaryTree:
         self.root = None
     
     def insert_level_order(self, data):
-        """Insert nodes level by level"""
+        """Insert nodes level by level - O(n) BFS per insert (see CompleteBinaryTree)"""
         new_node = TreeNode(data)
         
         if not self.root:
@@ -49,113 +221,1445 @@ class BinaryTree:
         """Left -> Root -> Right"""
         if result is None:
             result = []
-        if node:
-            self.inorder(node.left, result)
-            result.append(node.data)
-            self.inorder(node.right, result)
+        result.extend(n.data for n in _iter_inorder(node))
         return result
     
-    def level_order(self):
-        """Breadth-first traversal"""
-        if not self.root:
-            return []
-        
-        queue = deque([self.root])
-        result = []
-        
+    def iter_inorder(self):
+        """Lazy Left -> Root -> Right traversal (no recursion)"""
+        return (node.data for node in _iter_inorder(self.root))
+    
+    def iter_preorder(self):
+        """Lazy Root -> Left -> Right traversal (no recursion)"""
+        return (node.data for node in _iter_preorder(self.root))
+    
+    def iter_postorder(self):
+        """Lazy Left -> Right -> Root traversal (no recursion)"""
+        return (node.data for node in _iter_postorder(self.root))
+    
+    def iter_level_order(self):
+        """Lazy breadth-first traversal"""
+        queue = deque([self.root] if self.root else [])
         while queue:
             node = queue.popleft()
-            result.append(node.data)
+            yield node.data
             if node.left:
                 queue.append(node.left)
             if node.right:
                 queue.append(node.right)
-        
-        return result
+    
+    def level_order(self):
+        """Breadth-first traversal"""
+        return list(self.iter_level_order())
     
     def height(self, node):
-        """Get tree height"""
-        if not node:
-            return 0
-        return 1 + max(self.height(node.left), self.height(node.right))
+        """Get tree height (level by level, no recursion)"""
+        return _depth(node)
+    
+    MAGIC = b'BTR1'
+    
+    def dump(self, fp):
+        """
+        Stream the tree to a binary file: node count, then each node in
+        preorder as a structure byte (1 = has left, 2 = has right) + value
+        """
+        nodes = sum(1 for _ in _iter_preorder(self.root))
+        writer = _TreeWriter(fp)
+        writer.buffer += self.MAGIC
+        writer.varint(nodes)
+        for node in _iter_preorder(self.root):
+            writer.byte((1 if node.left else 0) | (2 if node.right else 0))
+            writer.value(node.data)
+        writer.flush()
+    
+    @classmethod
+    def load(cls, fp):
+        """Rebuild a tree written by dump() in one streaming pass - O(n)"""
+        reader = _TreeReader(fp)
+        tree = cls()
+        pending = []  # [node, child bits still to attach], deepest last
+        for _ in range(reader.header(cls.MAGIC)):
+            flags = reader.byte()
+            node = TreeNode(reader.value())
+            if pending:
+                entry = pending[-1]
+                if entry[1] & 1:
+                    entry[0].left = node
+                    entry[1] &= ~1
+                else:
+                    entry[0].right = node
+                    entry[1] &= ~2
+                if not entry[1]:
+                    pending.pop()
+            else:
+                tree.root = node
+            if flags:
+                pending.append([node, flags])
+        reader.release()
+        return tree
+
+
+class CompleteBinaryTree:
+    """
+    Complete binary tree stored implicitly in a list (like a heap):
+    node i has children 2i+1 / 2i+2 and parent (i-1)//2.
+    - append: O(1) amortized (vs. a BFS per insert_level_order)
+    - parent/left/right navigation: O(1) index arithmetic
+    - height: O(1), level order: the list itself
+    """
+    
+    def __init__(self, values=()):
+        self.data = list(values)
+    
+    def __len__(self):
+        return len(self.data)
+    
+    def append(self, data):
+        """Add the next node in level order"""
+        self.data.append(data)
+    
+    def get(self, index):
+        if index < 0 or index >= len(self.data):
+            raise IndexError("Index out of bounds")
+        return self.data[index]
+    
+    def parent(self, index):
+        """Parent index, or None for the root"""
+        return (index - 1) // 2 if index > 0 else None
+    
+    def left(self, index):
+        """Left child index, or None if absent"""
+        child = 2 * index + 1
+        return child if child < len(self.data) else None
+    
+    def right(self, index):
+        """Right child index, or None if absent"""
+        child = 2 * index + 2
+        return child if child < len(self.data) else None
+    
+    def height(self):
+        """Number of levels - O(1)"""
+        return len(self.data).bit_length()
+    
+    def level_order(self):
+        """Breadth-first traversal - the storage order"""
+        return list(self.data)
+    
+    def iter_inorder(self):
+        """Lazy Left -> Root -> Right traversal over indices"""
+        stack, index, n = [], 0, len(self.data)
+        while stack or index < n:
+            while index < n:
+                stack.append(index)
+                index = 2 * index + 1
+            index = stack.pop()
+            yield self.data[index]
+            index = 2 * index + 2
+    
+    def inorder(self):
+        return list(self.iter_inorder())
+    
+    def to_binary_tree(self):
+        """Linked BinaryTree with the same shape - O(n)"""
+        nodes = [TreeNode(data) for data in self.data]
+        for i in range(1, len(nodes)):
+            parent = nodes[(i - 1) // 2]
+            if i % 2:
+                parent.left = nodes[i]
+            else:
+                parent.right = nodes[i]
+        tree = BinaryTree()
+        tree.root = nodes[0] if nodes else None
+        return tree
+    
+    @classmethod
+    def from_binary_tree(cls, tree):
+        """Array form of a linked BinaryTree; it must be complete"""
+        values = []
+        queue = deque([tree.root] if tree.root else [])
+        gap = False
+        while queue:
+            node = queue.popleft()
+            values.append(node.data)
+            for child in (node.left, node.right):
+                if child is None:
+                    gap = True
+                elif gap:
+                    raise ValueError("Tree is not complete")
+                else:
+                    queue.append(child)
+        return cls(values)
+
+
+class BSTNode(TreeNode):
+    """TreeNode that also counts the nodes in its subtree (for rank/select)"""
+    __slots__ = ('size',)
+    
+    def __init__(self, data):
+        super().__init__(data)
+        self.size = 1
+
+
+def _size(node):
+    return node.size if node else 0
 
 
 class BinarySearchTree:
-    """BST: Left < Parent < Right"""
+    """
+    BST: Left < Parent < Right
+    Every node keeps its subtree size, so rank/select run in O(h)
+    alongside insert, delete, search, floor/ceiling and range scans.
+    """
+    
+    node_class = BSTNode
     
     def __init__(self):
         self.root = None
     
+    def __len__(self):
+        return _size(self.root)
+    
+    def _update(self, node):
+        """Recompute node's augmented fields from its children"""
+        node.size = 1 + _size(node.left) + _size(node.right)
+    
+    def _build_balanced(self, values, n):
+        """
+        Perfectly balanced subtree from the next n values of a sorted
+        iterator - O(n), recursion depth only log2(n)
+        """
+        if n == 0:
+            return None
+        left = self._build_balanced(values, n // 2)
+        node = self.node_class(next(values))
+        node.left = left
+        node.right = self._build_balanced(values, n - n // 2 - 1)
+        self._update(node)
+        return node
+    
+    @classmethod
+    def from_sorted(cls, values):
+        """Balanced tree from ascending values in O(n); duplicates are dropped"""
+        keys = []
+        for value in values:
+            if keys and value <= keys[-1]:
+                if value == keys[-1]:
+                    continue
+                raise ValueError("Input is not sorted")
+            keys.append(value)
+        
+        tree = cls()
+        tree.root = tree._build_balanced(iter(keys), len(keys))
+        return tree
+    
+    @classmethod
+    def from_iterable(cls, values):
+        """Balanced tree from values in any order - O(n log n) sort + O(n) build"""
+        return cls.from_sorted(sorted(values))
+    
+    def merge(self, other):
+        """New balanced tree with the keys of both trees - O(n + m)"""
+        merged = heapq.merge(self.iter_inorder(), other.iter_inorder())
+        return type(self).from_sorted(merged)
+    
+    MAGIC = b'BST1'
+    
+    def dump(self, fp):
+        """Stream the sorted keys to a binary file (count + compact values)"""
+        writer = _TreeWriter(fp)
+        writer.buffer += self.MAGIC
+        writer.varint(len(self))
+        for node in _iter_inorder(self.root):
+            writer.value(node.data)
+        writer.flush()
+    
+    @classmethod
+    def load(cls, fp):
+        """
+        Rebuild a perfectly balanced tree from dump() output in O(n),
+        building nodes straight from the stream (no intermediate list)
+        """
+        reader = _TreeReader(fp)
+        count = reader.header(cls.MAGIC)
+        tree = cls()
+        tree.root = tree._build_balanced((reader.value() for _ in range(count)), count)
+        reader.release()
+        return tree
+    
     def insert(self, data):
         """Insert node maintaining BST property"""
+        path = []
+        node = self.root
+        while node:
+            if data == node.data:
+                return
+            path.append(node)
+            node = node.left if data < node.data else node.right
+        
+        new_node = self.node_class(data)
+        if not path:
+            self.root = new_node
+        elif data < path[-1].data:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
+        for ancestor in path:
+            ancestor.size += 1
+    
+    def delete(self, data):
+        """Remove data if present; return whether it was found - O(h)"""
+        path = []
+        node = self.root
+        while node and node.data != data:
+            path.append(node)
+            node = node.left if data < node.data else node.right
+        if not node:
+            return False
+        
+        if node.left and node.right:
+            # Two children: move the inorder successor's value up and
+            # unlink the successor instead (it has no left child)
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data
+            node = successor
+        
+        child = node.left or node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        for ancestor in path:
+            ancestor.size -= 1
+        return True
+    
+    def search(self, data):
+        """Search for value - O(log n) average"""
+        node = self.root
+        while node:
+            if data == node.data:
+                return True
+            node = node.left if data < node.data else node.right
+        return False
+    
+    def min(self):
+        """Smallest value (None if empty)"""
+        node = self.root
+        while node and node.left:
+            node = node.left
+        return node.data if node else None
+    
+    def max(self):
+        """Largest value (None if empty)"""
+        node = self.root
+        while node and node.right:
+            node = node.right
+        return node.data if node else None
+    
+    def floor(self, data):
+        """Largest value <= data (None if there is none)"""
+        node, best = self.root, None
+        while node:
+            if node.data == data:
+                return data
+            if node.data < data:
+                best = node.data
+                node = node.right
+            else:
+                node = node.left
+        return best
+    
+    def ceiling(self, data):
+        """Smallest value >= data (None if there is none)"""
+        node, best = self.root, None
+        while node:
+            if node.data == data:
+                return data
+            if node.data > data:
+                best = node.data
+                node = node.left
+            else:
+                node = node.right
+        return best
+    
+    def range(self, low, high):
+        """
+        Lazily yield values with low <= value <= high in order,
+        skipping subtrees that lie entirely outside the range
+        """
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                if node.data < low:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.data > high:
+                return
+            yield node.data
+            node = node.right
+    
+    def rank(self, data):
+        """Number of values strictly less than data - O(h)"""
+        node, count = self.root, 0
+        while node:
+            if data <= node.data:
+                node = node.left
+            else:
+                count += _size(node.left) + 1
+                node = node.right
+        return count
+    
+    def select(self, k):
+        """k-th smallest value (0-based) - O(h)"""
+        if not 0 <= k < len(self):
+            raise IndexError("Rank out of bounds")
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if k < left:
+                node = node.left
+            elif k == left:
+                return node.data
+            else:
+                k -= left + 1
+                node = node.right
+    
+    def inorder(self):
+        """Inorder gives sorted output"""
+        return list(self.iter_inorder())
+    
+    def iter_inorder(self):
+        """Lazy sorted traversal (no recursion)"""
+        return (node.data for node in _iter_inorder(self.root))
+
+
+class AVLNode(BSTNode):
+    """BSTNode that also stores the height of its subtree"""
+    __slots__ = ('height',)
+    
+    def __init__(self, data):
+        super().__init__(data)
+        self.height = 1
+
+
+class AVLTree(BinarySearchTree):
+    """
+    Self-balancing BST (AVL): subtree heights differ by at most 1,
+    so height stays <= ~1.44 log2(n) whatever the insert order.
+    Insert / Search / Delete: O(log n) guaranteed
+    """
+    
+    node_class = AVLNode
+    
+    @staticmethod
+    def _height(node):
+        return node.height if node else 0
+    
+    def _update(self, node):
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + _size(node.left) + _size(node.right)
+    
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+    
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+    
+    def _rebalance(self, node):
+        """Restore the AVL property at node after a child changed"""
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+    
+    def insert(self, data):
+        """Insert node, rebalancing on the way back up - O(log n)"""
         self.root = self._insert_rec(self.root, data)
     
     def _insert_rec(self, node, data):
         if not node:
-            return TreeNode(data)
+            return AVLNode(data)
         
         if data < node.data:
             node.left = self._insert_rec(node.left, data)
         elif data > node.data:
             node.right = self._insert_rec(node.right, data)
+        else:
+            return node
         
-        return node
+        return self._rebalance(node)
     
-    def search(self, data):
-        """Search for value - O(log n) average"""
-        return self._search_rec(self.root, data)
+    def delete(self, data):
+        """Remove data if present; return whether it was found - O(log n)"""
+        if not self.search(data):
+            return False
+        self.root = self._delete_rec(self.root, data)
+        return True
     
-    def _search_rec(self, node, data):
-        if not node or node.data == data:
-            return node is not None
+    def _delete_rec(self, node, data):
+        if not node:
+            return None
         
         if data < node.data:
-            return self._search_rec(node.left, data)
-        return self._search_rec(node.right, data)
+            node.left = self._delete_rec(node.left, data)
+        elif data > node.data:
+            node.right = self._delete_rec(node.right, data)
+        else:
+            if not node.left:
+                return node.right
+            if not node.right:
+                return node.left
+            # Two children: take the inorder successor's value
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.data = successor.data
+            node.right = self._delete_rec(node.right, successor.data)
+        
+        return self._rebalance(node)
+
+
+def benchmark_balancing(n=2000):
+    """
+    Insert n keys in sorted, random and adversarial (zig-zag) order into
+    BinarySearchTree and AVLTree; report tree height and insert/search time
+    """
+    import random
+    from time import perf_counter
+    
+    orders = {
+        "sorted": list(range(n)),
+        "random": random.sample(range(n), n),
+        "zig-zag": [k for pair in zip(range(n // 2), range(n - 1, n // 2 - 1, -1))
+                    for k in pair],
+    }
+    
+    print(f"{'order':8} | {'tree':16} | {'height':>6} | {'insert ms':>9} | {'search ms':>9}")
+    for order, keys in orders.items():
+        for tree_class in (BinarySearchTree, AVLTree):
+            tree = tree_class()
+            start = perf_counter()
+            for key in keys:
+                tree.insert(key)
+            insert_ms = (perf_counter() - start) * 1000
+            
+            start = perf_counter()
+            for key in keys:
+                tree.search(key)
+            search_ms = (perf_counter() - start) * 1000
+            print(f"{order:8} | {tree_class.__name__:16} | {_depth(tree.root):>6} | "
+                  f"{insert_ms:>9.1f} | {search_ms:>9.1f}")
+
+
+class TreeNodePool:
+    """
+    Struct-of-arrays node storage: a node is an integer index into
+    parallel arrays (data list + compact int64 left/right links).
+    NIL (-1) plays the role of None; freed slots are reused.
+    """
+    
+    NIL = -1
+    
+    def __init__(self):
+        self.data = []
+        self.left = array('q')
+        self.right = array('q')
+        self.free = []
+    
+    def alloc(self, data):
+        """Return the index of a fresh leaf node holding data"""
+        if self.free:
+            node = self.free.pop()
+            self.data[node] = data
+            self.left[node] = self.right[node] = self.NIL
+            return node
+        self.data.append(data)
+        self.left.append(self.NIL)
+        self.right.append(self.NIL)
+        return len(self.data) - 1
+    
+    def release(self, node):
+        """Return node's slot to the free list"""
+        self.data[node] = None
+        self.free.append(node)
+    
+    def __len__(self):
+        return len(self.data) - len(self.free)
+
+
+class PooledBinarySearchTree:
+    """BST whose nodes live in a TreeNodePool instead of TreeNode objects"""
+    
+    def __init__(self):
+        self.pool = TreeNodePool()
+        self.root = TreeNodePool.NIL
+    
+    def insert(self, data):
+        """Insert node maintaining BST property"""
+        pool, nil = self.pool, TreeNodePool.NIL
+        if self.root == nil:
+            self.root = pool.alloc(data)
+            return
+        
+        node = self.root
+        while True:
+            if data < pool.data[node]:
+                links = pool.left
+            elif data > pool.data[node]:
+                links = pool.right
+            else:
+                return
+            if links[node] == nil:
+                links[node] = pool.alloc(data)
+                return
+            node = links[node]
+    
+    def delete(self, data):
+        """Delete value and return its slot to the pool's free list"""
+        pool, nil = self.pool, TreeNodePool.NIL
+        parent, node = nil, self.root
+        while node != nil and pool.data[node] != data:
+            parent = node
+            node = pool.left[node] if data < pool.data[node] else pool.right[node]
+        if node == nil:
+            return False
+        
+        if pool.left[node] != nil and pool.right[node] != nil:
+            # Two children: take the inorder successor's value, then
+            # splice out the successor (it has no left child)
+            parent, successor = node, pool.right[node]
+            while pool.left[successor] != nil:
+                parent, successor = successor, pool.left[successor]
+            pool.data[node] = pool.data[successor]
+            node = successor
+        
+        child = pool.left[node] if pool.left[node] != nil else pool.right[node]
+        if parent == nil:
+            self.root = child
+        elif pool.left[parent] == node:
+            pool.left[parent] = child
+        else:
+            pool.right[parent] = child
+        pool.release(node)
+        return True
+    
+    def search(self, data):
+        """Search for value - O(log n) average"""
+        pool, node = self.pool, self.root
+        while node != TreeNodePool.NIL:
+            if data == pool.data[node]:
+                return True
+            node = pool.left[node] if data < pool.data[node] else pool.right[node]
+        return False
     
     def inorder(self):
         """Inorder gives sorted output"""
-        result = []
-        self._inorder_rec(self.root, result)
+        pool, node, stack, result = self.pool, self.root, [], []
+        while stack or node != TreeNodePool.NIL:
+            while node != TreeNodePool.NIL:
+                stack.append(node)
+                node = pool.left[node]
+            node = stack.pop()
+            result.append(pool.data[node])
+            node = pool.right[node]
         return result
+
+
+def benchmark_node_memory(n=10**6):
+    """Bytes per tree node: __dict__ object vs __slots__ object vs pool"""
+    import tracemalloc
     
-    def _inorder_rec(self, node, result):
-        if node:
-            self._inorder_rec(node.left, result)
-            result.append(node.data)
-            self._inorder_rec(node.right, result)
+    DictTreeNode = type('DictTreeNode', (), {'__init__': TreeNode.__init__})
+    
+    def build_objects(node_class):
+        # Complete tree shape; the same data object in every node
+        nodes = [node_class(0) for _ in range(n)]
+        for i in range(1, n):
+            parent = nodes[(i - 1) // 2]
+            if i % 2:
+                parent.left = nodes[i]
+            else:
+                parent.right = nodes[i]
+        return nodes[0]
+    
+    def build_pool():
+        pool = TreeNodePool()
+        for i in range(n):
+            pool.alloc(0)
+            if i:
+                links = pool.left if i % 2 else pool.right
+                links[(i - 1) // 2] = i
+        return pool
+    
+    for label, build in (("__dict__ node", lambda: build_objects(DictTreeNode)),
+                         ("__slots__ node", lambda: build_objects(TreeNode)),
+                         ("TreeNodePool", build_pool)):
+        tracemalloc.start()
+        kept = build()
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{label:16} {used / n:7.1f} bytes/node")
+        del kept
 
 
-# ==========================================
-# APPLICATIONS
-# ==========================================
+class BPlusLeaf:
+    """B+ tree leaf: sorted keys, their values, link to the next leaf"""
+    __slots__ = ('keys', 'values', 'next')
+    
+    def __init__(self, keys=None, values=None):
+        self.keys = keys if keys is not None else []
+        self.values = values if values is not None else []
+        self.next = None
 
-def file_system_demo():
-    """File system hierarchy"""
-    class FileNode:
-        def __init__(self, name, is_file=False):
-            self.name = name
-            self.is_file = is_file
-            self.children = []
+
+class BPlusInternal:
+    """B+ tree internal node: child i holds keys in [keys[i-1], keys[i])"""
+    __slots__ = ('keys', 'children')
+    
+    def __init__(self, keys, children):
+        self.keys = keys
+        self.children = children
+
+
+class BPlusTree:
+    """
+    B+ tree ordered index (key -> value)
+    - Each node holds up to order-1 keys in a Python list, so a million
+      keys need ~n/order nodes instead of n TreeNodes
+    - All keys live in leaves, which are linked for range scans
+    Insert / Search / Delete: O(log_order n); range scan: O(log n + k)
+    """
+    
+    def __init__(self, order=64):
+        if order < 3:
+            raise ValueError("order must be at least 3")
+        self.order = order
+        self.max_keys = order - 1
+        self.min_keys = (order - 1) // 2
+        self.root = BPlusLeaf()
+        self.length = 0
+    
+    def __len__(self):
+        return self.length
+    
+    def __contains__(self, key):
+        return self.search(key)
+    
+    def _find_leaf(self, key, path=None):
+        """Descend to the leaf for key, recording (node, child index) in path"""
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            index = bisect_right(node.keys, key)
+            if path is not None:
+                path.append((node, index))
+            node = node.children[index]
+        return node
+    
+    def search(self, key):
+        """Check if key is present"""
+        leaf = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        return index < len(leaf.keys) and leaf.keys[index] == key
+    
+    def get(self, key, default=None):
+        """Value stored for key, or default"""
+        leaf = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            return leaf.values[index]
+        return default
+    
+    def insert(self, key, value=None):
+        """Insert key (or replace its value), splitting full nodes upward"""
+        path = []
+        leaf = self._find_leaf(key, path)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            leaf.values[index] = value
+            return
+        
+        leaf.keys.insert(index, key)
+        leaf.values.insert(index, value)
+        self.length += 1
+        if len(leaf.keys) <= self.max_keys:
+            return
+        
+        # Split the leaf; its right half's first key goes up as separator
+        mid = len(leaf.keys) // 2
+        right = BPlusLeaf(leaf.keys[mid:], leaf.values[mid:])
+        del leaf.keys[mid:], leaf.values[mid:]
+        right.next, leaf.next = leaf.next, right
+        separator, new_child = right.keys[0], right
+        
+        while path:
+            parent, index = path.pop()
+            parent.keys.insert(index, separator)
+            parent.children.insert(index + 1, new_child)
+            if len(parent.keys) <= self.max_keys:
+                return
+            mid = len(parent.keys) // 2
+            separator = parent.keys[mid]
+            new_child = BPlusInternal(parent.keys[mid + 1:], parent.children[mid + 1:])
+            del parent.keys[mid:], parent.children[mid + 1:]
+        
+        self.root = BPlusInternal([separator], [self.root, new_child])
+    
+    def delete(self, key):
+        """Remove key; return whether it was found"""
+        path = []
+        node = self._find_leaf(key, path)
+        index = bisect_left(node.keys, key)
+        if index == len(node.keys) or node.keys[index] != key:
+            return False
+        
+        del node.keys[index], node.values[index]
+        self.length -= 1
+        
+        while path and len(node.keys) < self.min_keys:
+            parent, index = path.pop()
+            self._fix_underflow(parent, index)
+            node = parent
+        
+        if isinstance(self.root, BPlusInternal) and not self.root.keys:
+            self.root = self.root.children[0]
+        return True
+    
+    def _fix_underflow(self, parent, index):
+        """Borrow from a sibling of parent.children[index], or merge with it"""
+        node = parent.children[index]
+        left = parent.children[index - 1] if index > 0 else None
+        right = parent.children[index + 1] if index + 1 < len(parent.children) else None
+        leaf = isinstance(node, BPlusLeaf)
+        
+        if left and len(left.keys) > self.min_keys:
+            if leaf:
+                node.keys.insert(0, left.keys.pop())
+                node.values.insert(0, left.values.pop())
+                parent.keys[index - 1] = node.keys[0]
+            else:
+                node.keys.insert(0, parent.keys[index - 1])
+                node.children.insert(0, left.children.pop())
+                parent.keys[index - 1] = left.keys.pop()
+        elif right and len(right.keys) > self.min_keys:
+            if leaf:
+                node.keys.append(right.keys.pop(0))
+                node.values.append(right.values.pop(0))
+                parent.keys[index] = right.keys[0]
+            else:
+                node.keys.append(parent.keys[index])
+                node.children.append(right.children.pop(0))
+                parent.keys[index] = right.keys.pop(0)
+        else:
+            if left:
+                index -= 1
+                node, right = left, node
+            # Merge right into node and drop the separator between them
+            if leaf:
+                node.keys += right.keys
+                node.values += right.values
+                node.next = right.next
+            else:
+                node.keys += [parent.keys[index]] + right.keys
+                node.children += right.children
+            del parent.keys[index], parent.children[index + 1]
+    
+    def items(self, low=None, high=None):
+        """Lazily yield (key, value) with low <= key <= high by walking leaf links"""
+        leaf = self._find_leaf(low) if low is not None else self._first_leaf()
+        index = bisect_left(leaf.keys, low) if low is not None else 0
+        while leaf:
+            for i in range(index, len(leaf.keys)):
+                if high is not None and leaf.keys[i] > high:
+                    return
+                yield leaf.keys[i], leaf.values[i]
+            leaf, index = leaf.next, 0
+    
+    def range(self, low, high):
+        """Lazily yield keys with low <= key <= high in order"""
+        return (key for key, _ in self.items(low, high))
+    
+    def _first_leaf(self):
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[0]
+        return node
+    
+    def height(self):
+        """Number of levels (all leaves are at the same depth)"""
+        levels, node = 1, self.root
+        while isinstance(node, BPlusInternal):
+            levels += 1
+            node = node.children[0]
+        return levels
+    
+    @staticmethod
+    def _even_chunks(count, capacity):
+        """Split count items into the fewest chunks of <= capacity, sizes as even as possible"""
+        chunks = max(1, -(-count // capacity))
+        return [(i * count // chunks, (i + 1) * count // chunks) for i in range(chunks)]
+    
+    @classmethod
+    def from_sorted(cls, keys, values=None, order=64):
+        """Bulk-load strictly ascending keys bottom-up in O(n) with near-full nodes"""
+        keys = list(keys)
+        values = list(values) if values is not None else [None] * len(keys)
+        if len(values) != len(keys):
+            raise ValueError("keys and values differ in length")
+        if any(keys[i] >= keys[i + 1] for i in range(len(keys) - 1)):
+            raise ValueError("Keys must be strictly ascending")
+        
+        tree = cls(order)
+        tree.length = len(keys)
+        if not keys:
+            return tree
+        
+        level = [BPlusLeaf(keys[a:b], values[a:b])
+                 for a, b in cls._even_chunks(len(keys), tree.max_keys)]
+        for leaf, next_leaf in zip(level, level[1:]):
+            leaf.next = next_leaf
+        lows = [leaf.keys[0] for leaf in level]
+        
+        while len(level) > 1:
+            parents, parent_lows = [], []
+            for a, b in cls._even_chunks(len(level), order):
+                parents.append(BPlusInternal(lows[a + 1:b], level[a:b]))
+                parent_lows.append(lows[a])
+            level, lows = parents, parent_lows
+        
+        tree.root = level[0]
+        return tree
+
+
+def benchmark_bplus_tree(n=10**6, lookups=100_000, scans=1000, span=100):
+    """
+    BPlusTree vs BinarySearchTree (both bulk-loaded from n sorted keys):
+    memory, point lookups and short range scans
+    """
+    import random
+    import tracemalloc
+    from time import perf_counter
+    
+    keys = range(n)
+    probes = [random.randrange(n) for _ in range(lookups)]
+    starts = [random.randrange(n - span) for _ in range(scans)]
+    
+    print(f"{'index':16} | {'MB':>7} | {'lookups ms':>10} | {'scans ms':>8}")
+    for label, build in (("BinarySearchTree", lambda: BinarySearchTree.from_sorted(keys)),
+                         ("BPlusTree(64)", lambda: BPlusTree.from_sorted(keys))):
+        tracemalloc.start()
+        tree = build()
+        memory = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+        
+        start = perf_counter()
+        for key in probes:
+            tree.search(key)
+        lookup_ms = (perf_counter() - start) * 1000
+        
+        start = perf_counter()
+        for low in starts:
+            for _ in tree.range(low, low + span):
+                pass
+        scan_ms = (perf_counter() - start) * 1000
+        
+        print(f"{label:16} | {memory:>7.1f} | {lookup_ms:>10.1f} | {scan_ms:>8.1f}")
+        del tree
+
+
+class ExpressionTree:
+    """
+    Arithmetic expression tree built from TreeNodes
+    - operator nodes hold a symbol from BINARY_OPS (two children)
+      or UNARY_OPS (operand in .left)
+    - leaves hold numbers (constants) or strings (variable names)
+    
+    compile() flattens the tree once into a postfix program, folding
+    every constant subtree into a single value; evaluate() and
+    evaluate_many() run that program on a stack machine instead of
+    re-walking the tree. Call compile() again after editing nodes.
+    """
+    
+    BINARY_OPS = {
+        '+': operator.add, '-': operator.sub, '*': operator.mul,
+        '/': operator.truediv, '//': operator.floordiv, '%': operator.mod,
+        '**': operator.pow, 'min': min, 'max': max,
+    }
+    UNARY_OPS = {'neg': operator.neg, 'abs': abs}
+    
+    # Program instruction kinds
+    CONST, VAR, UNARY, BINARY = range(4)
+    
+    def __init__(self, root):
+        self.root = root
+        self.program = None
+    
+    @classmethod
+    def from_postfix(cls, tokens):
+        """Build from postfix tokens, e.g. ['price', 'qty', '*', 2, '-']"""
+        stack = []
+        for token in tokens:
+            node = TreeNode(token)
+            if token in cls.BINARY_OPS:
+                if len(stack) < 2:
+                    raise ValueError(f"Operator {token!r} is missing operands")
+                node.right = stack.pop()
+                node.left = stack.pop()
+            elif token in cls.UNARY_OPS:
+                if not stack:
+                    raise ValueError(f"Operator {token!r} is missing an operand")
+                node.left = stack.pop()
+            stack.append(node)
+        if len(stack) != 1:
+            raise ValueError("Malformed postfix expression")
+        return cls(stack[0])
+    
+    def variables(self):
+        """Names of the variables used in the expression"""
+        return {node.data for node in _iter_preorder(self.root)
+                if not node.left and not node.right and isinstance(node.data, str)}
+    
+    def compile(self):
+        """Flatten to a postfix program with constant subtrees folded - O(n)"""
+        program = []
+        constant = []  # per finished subtree: did it fold to one CONST?
+        
+        for node in _iter_postorder(self.root):
+            if not node.left and not node.right:
+                is_const = not isinstance(node.data, str)
+                program.append((self.CONST if is_const else self.VAR, node.data))
+                constant.append(is_const)
+            elif node.data in self.BINARY_OPS:
+                func = self.BINARY_OPS[node.data]
+                right_const, left_const = constant.pop(), constant.pop()
+                if left_const and right_const:
+                    right = program.pop()[1]
+                    program[-1] = (self.CONST, func(program[-1][1], right))
+                else:
+                    program.append((self.BINARY, func))
+                constant.append(left_const and right_const)
+            elif node.data in self.UNARY_OPS:
+                func = self.UNARY_OPS[node.data]
+                if constant[-1]:
+                    program[-1] = (self.CONST, func(program[-1][1]))
+                else:
+                    program.append((self.UNARY, func))
+            else:
+                raise ValueError(f"Unknown operator {node.data!r}")
+        
+        self.program = program
+        return program
+    
+    def _run(self, variables):
+        stack = []
+        push, pop = stack.append, stack.pop
+        for kind, arg in self.program:
+            if kind == self.CONST:
+                push(arg)
+            elif kind == self.VAR:
+                push(variables[arg])
+            elif kind == self.BINARY:
+                right = pop()
+                stack[-1] = arg(stack[-1], right)
+            else:
+                stack[-1] = arg(stack[-1])
+        return stack[0]
+    
+    def evaluate(self, variables=None):
+        """Value of the expression for one set of variable bindings"""
+        if self.program is None:
+            self.compile()
+        return self._run(variables or {})
+    
+    def evaluate_many(self, rows):
+        """Evaluate for each bindings dict in rows; compiled only once"""
+        if self.program is None:
+            self.compile()
+        run = self._run
+        return [run(variables) for variables in rows]
+    
+    def to_infix(self):
+        """Fully parenthesised infix string"""
+        parts = []
+        for node in _iter_postorder(self.root):
+            if not node.left and not node.right:
+                parts.append(str(node.data))
+            elif node.data in self.UNARY_OPS:
+                parts.append(f"{node.data}({parts.pop()})")
+            elif node.data in ('min', 'max'):
+                right = parts.pop()
+                parts.append(f"{node.data}({parts.pop()}, {right})")
+            else:
+                right = parts.pop()
+                parts.append(f"({parts.pop()} {node.data} {right})")
+        return parts[0]
+
+
+class FileNode:
+    """
+    File or directory in a FileSystemTree
+    Directories key their children by name (O(1) lookup) and keep
+    file_count / total_size for their whole subtree up to date.
+    """
+    __slots__ = ('name', 'is_file', 'size', 'parent', 'children',
+                 'file_count', 'total_size')
+    
+    def __init__(self, name, is_file=False, size=0):
+        self.name = name
+        self.is_file = is_file
+        self.size = size
+        self.parent = None
+        self.children = None if is_file else {}
+        self.file_count = 1 if is_file else 0
+        self.total_size = size
+    
+    def _propagate(self, files, size):
+        """Add deltas to this node and every ancestor - O(depth)"""
+        node = self
+        while node:
+            node.file_count += files
+            node.total_size += size
+            node = node.parent
+    
+    def add_child(self, child):
+        if self.is_file:
+            raise NotADirectoryError(self.name)
+        if child.name in self.children:
+            raise FileExistsError(child.name)
+        self.children[child.name] = child
+        child.parent = self
+        self._propagate(child.file_count, child.total_size)
+        return child
+    
+    def remove_child(self, name):
+        child = self.children.pop(name)
+        child.parent = None
+        self._propagate(-child.file_count, -child.total_size)
+        return child
+    
+    def path(self):
+        parts = []
+        node = self
+        while node.parent:
+            parts.append(node.name)
+            node = node.parent
+        return "/" + "/".join(reversed(parts))
+    
+    def display(self, level=0):
+        """Print this subtree (explicit stack, children in insertion order)"""
+        stack = [(self, level)]
+        while stack:
+            node, depth = stack.pop()
+            symbol = "📄" if node.is_file else "📁"
+            print(f"{'  ' * depth}{symbol} {node.name}")
+            if not node.is_file:
+                stack.extend((child, depth + 1)
+                             for child in reversed(node.children.values()))
+
+
+class FileSystemTree:
+    """
+    Hierarchical path store, e.g. '/C:/Documents/report.pdf'
+    - resolve / add / remove: O(depth) via name-keyed children
+    - per-directory file counts and sizes maintained incrementally
+    - walk(): lazy depth-first stream of (path, node)
+    """
+    
+    def __init__(self):
+        self.root = FileNode("/")
+    
+    @staticmethod
+    def _split(path):
+        return [part for part in path.split("/") if part]
+    
+    def resolve(self, path):
+        """Node at path, or None if it does not exist"""
+        node = self.root
+        for part in self._split(path):
+            if node.is_file:
+                return None
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+    
+    def _parent_dir(self, parts):
+        """Directory holding parts[-1], creating missing directories"""
+        node = self.root
+        for part in parts[:-1]:
+            child = node.children.get(part)
+            if child is None:
+                child = node.add_child(FileNode(part))
+            elif child.is_file:
+                raise NotADirectoryError(child.path())
+            node = child
+        return node
+    
+    def mkdir(self, path):
+        """Create a directory (and any missing parents); return it"""
+        parts = self._split(path)
+        if not parts:
+            return self.root
+        parent = self._parent_dir(parts)
+        existing = parent.children.get(parts[-1])
+        if existing is not None:
+            if existing.is_file:
+                raise FileExistsError(path)
+            return existing
+        return parent.add_child(FileNode(parts[-1]))
+    
+    def add_file(self, path, size=0):
+        """Create a file (and any missing parent directories); return it"""
+        parts = self._split(path)
+        if not parts:
+            raise FileExistsError(path)
+        return self._parent_dir(parts).add_child(FileNode(parts[-1], True, size))
+    
+    def set_size(self, path, size):
+        """Change a file's size; ancestors' totals follow"""
+        node = self.resolve(path)
+        if node is None or not node.is_file:
+            raise FileNotFoundError(path)
+        node._propagate(0, size - node.size)
+        node.size = size
+    
+    def remove(self, path):
+        """Remove a file or a whole directory subtree; return it"""
+        node = self.resolve(path)
+        if node is None or node is self.root:
+            raise FileNotFoundError(path)
+        return node.parent.remove_child(node.name)
+    
+    def walk(self, path="/"):
+        """Lazily yield (path, node) depth-first below path"""
+        start = self.resolve(path)
+        if start is None:
+            raise FileNotFoundError(path)
+        stack = [(start.path(), start)]
+        while stack:
+            node_path, node = stack.pop()
+            yield node_path, node
+            if not node.is_file:
+                prefix = node_path.rstrip("/")
+                stack.extend((f"{prefix}/{child.name}", child)
+                             for child in reversed(node.children.values()))
+    
+    def display(self):
+        for child in self.root.children.values():
+            child.display()
+
+
+class RadixNode:
+    """Radix trie node: label is the edge string leading into this node"""
+    __slots__ = ('label', 'children', 'is_key')
+    
+    def __init__(self, label="", is_key=False):
+        self.label = label
+        self.children = {}  # first character of child.label -> child
+        self.is_key = is_key
+
+
+class RadixTrie:
+    """
+    Compressed (radix) trie for string keys
+    Chains of single-child nodes are merged into one edge label, so the
+    node count is at most 2x the key count.
+    - insert / search / delete: O(key length)
+    - starts_with(prefix): lazy, yields matches in sorted order
+    """
+    
+    def __init__(self):
+        self.root = RadixNode()
+        self.length = 0
+    
+    def __len__(self):
+        return self.length
+    
+    def __contains__(self, key):
+        return self.search(key)
+    
+    @staticmethod
+    def _common_prefix(a, b):
+        n = min(len(a), len(b))
+        i = 0
+        while i < n and a[i] == b[i]:
+            i += 1
+        return i
+    
+    def insert(self, key):
+        """Add key; return False if it was already present"""
+        node, i = self.root, 0
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None:
+                node.children[key[i]] = RadixNode(key[i:], True)
+                self.length += 1
+                return True
+            
+            common = self._common_prefix(child.label, key[i:])
+            if common < len(child.label):
+                # Split the edge: node -> middle -> child
+                middle = RadixNode(child.label[:common])
+                child.label = child.label[common:]
+                middle.children[child.label[0]] = child
+                node.children[key[i]] = middle
+                child = middle
+            node, i = child, i + common
         
-        def add_child(self, child):
-            self.children.append(child)
+        if node.is_key:
+            return False
+        node.is_key = True
+        self.length += 1
+        return True
+    
+    def search(self, key):
+        """Check if key is stored - O(key length)"""
+        node, i = self.root, 0
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None or not key.startswith(child.label, i):
+                return False
+            node, i = child, i + len(child.label)
+        return node.is_key
+    
+    def delete(self, key):
+        """Remove key, re-merging edges; return whether it was found"""
+        path = []
+        node, i = self.root, 0
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None or not key.startswith(child.label, i):
+                return False
+            path.append(node)
+            node, i = child, i + len(child.label)
+        if not node.is_key:
+            return False
+        
+        node.is_key = False
+        self.length -= 1
+        if not path:
+            return True
+        
+        parent = path[-1]
+        if not node.children:
+            del parent.children[node.label[0]]
+            node = parent
+            parent = path[-2] if len(path) > 1 else None
+        if node is not self.root and not node.is_key and len(node.children) == 1:
+            # A non-key node with one child is just a split edge: merge
+            (child,) = node.children.values()
+            child.label = node.label + child.label
+            parent.children[child.label[0]] = child
+        return True
+    
+    def starts_with(self, prefix):
+        """Lazily yield every key beginning with prefix, in sorted order"""
+        node, i = self.root, 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                return
+            rest = prefix[i:]
+            if not (child.label.startswith(rest) or rest.startswith(child.label)):
+                return
+            node, i = child, i + len(child.label)
         
-        def display(self, level=0):
-            indent = "  " * level
-            symbol = "📄" if self.is_file else "📁"
-            print(f"{indent}{symbol} {self.name}")
-            for child in self.children:
-                child.display(level + 1)
+        # i may overshoot the prefix when it ends inside the last edge
+        stack = [(node, prefix[:i - len(node.label)] + node.label if i else "")]
+        while stack:
+            node, word = stack.pop()
+            if node.is_key:
+                yield word
+            for first in sorted(node.children, reverse=True):
+                child = node.children[first]
+                stack.append((child, word + child.label))
+    
+    def memory_usage(self):
+        """(total bytes, bytes per key) for nodes, child dicts and labels"""
+        total = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            total += (sys.getsizeof(node) + sys.getsizeof(node.children)
+                      + sys.getsizeof(node.label))
+            stack.extend(node.children.values())
+        return total, total / self.length if self.length else 0.0
+
+
+def benchmark_prefix_search(n=10**6, queries=1000, limit=10):
+    """
+    Autocomplete latency on n random words: RadixTrie.starts_with vs
+    scanning BinarySearchTree.inorder() for the prefix (first `limit` hits)
+    """
+    import random
+    import string
+    from itertools import islice
+    from time import perf_counter
     
-    root = FileNode("C:")
-    documents = FileNode("Documents")
-    root.add_child(documents)
+    letters = string.ascii_lowercase
+    words = {"".join(random.choices(letters, k=random.randint(4, 10))) for _ in range(n)}
+    prefixes = ["".join(random.choices(letters, k=random.randint(1, 3))) for _ in range(queries)]
     
-    documents.add_child(FileNode("report.pdf", is_file=True))
-    documents.add_child(FileNode("notes.txt", is_file=True))
+    trie = RadixTrie()
+    for word in words:
+        trie.insert(word)
+    bst = BinarySearchTree.from_iterable(words)
+    total, per_key = trie.memory_usage()
+    print(f"RadixTrie: {len(trie)} keys, {total / 2**20:.1f} MB ({per_key:.0f} bytes/key)")
     
-    return root
+    start = perf_counter()
+    for prefix in prefixes:
+        list(islice(trie.starts_with(prefix), limit))
+    trie_us = (perf_counter() - start) * 1e6 / queries
+    
+    sample = prefixes[:max(1, queries // 100)]
+    start = perf_counter()
+    for prefix in sample:
+        [w for w in bst.inorder() if w.startswith(prefix)][:limit]
+    scan_us = (perf_counter() - start) * 1e6 / len(sample)
+    
+    print(f"starts_with (first {limit}): {trie_us:10.1f} us/query")
+    print(f"inorder() scan:          {scan_us:10.1f} us/query")
+
+
+# ==========================================
+# APPLICATIONS
+# ==========================================
+
+def file_system_demo():
+    """File system hierarchy"""
+    fs = FileSystemTree()
+    fs.mkdir("/C:/Documents")
+    fs.add_file("/C:/Documents/report.pdf", size=240_000)
+    fs.add_file("/C:/Documents/notes.txt", size=1_200)
+    return fs
 
 
 def expression_tree_demo():
@@ -166,19 +1670,7 @@ def expression_tree_demo():
     root.left.left = TreeNode(3)
     root.left.right = TreeNode(5)
     
-    def evaluate(node):
-        if not node.left and not node.right:
-            return node.data
-        
-        left = evaluate(node.left)
-        right = evaluate(node.right)
-        
-        if node.data == '+':
-            return left + right
-        elif node.data == '*':
-            return left * right
-    
-    return evaluate(root)
+    return ExpressionTree(root).evaluate()
 
 
 # ==========================================
@@ -197,8 +1689,18 @@ if __name__ == "__main__":
         bt.insert_level_order(val)
     
     print(f"Inorder:      {bt.inorder(bt.root)}")
+    print(f"Preorder:     {list(bt.iter_preorder())}")
+    print(f"Postorder:    {list(bt.iter_postorder())}")
     print(f"Level-order:  {bt.level_order()}")
-    print(f"Height:       {bt.height(bt.root)}\n")
+    print(f"Height:       {bt.height(bt.root)}")
+    
+    cbt = CompleteBinaryTree.from_binary_tree(bt)
+    cbt.append(8)
+    print("\nArray-backed complete tree (children at 2i+1 / 2i+2):")
+    print(f"Storage:      {cbt.level_order()}")
+    print(f"Inorder:      {cbt.inorder()}")
+    print(f"Parent of index 7 (value 8): index {cbt.parent(7)}")
+    print(f"Height:       {cbt.height()} (O(1) from the length)\n")
     
     print("="*50)
     print("2. BINARY SEARCH TREE")
@@ -212,22 +1714,120 @@ if __name__ == "__main__":
     
     print(f"Inorder (sorted): {bst.inorder()}")
     print(f"Search 40: {bst.search(40)}")
-    print(f"Search 25: {bst.search(25)}\n")
+    print(f"Search 25: {bst.search(25)}")
+    print(f"Min / Max: {bst.min()} / {bst.max()}")
+    print(f"Floor(45) / Ceiling(45): {bst.floor(45)} / {bst.ceiling(45)}")
+    print(f"Range [35, 65]: {list(bst.range(35, 65))}")
+    print(f"Range [100, 200] (above max): {list(bst.range(100, 200))}")
+    print(f"Rank(60): {bst.rank(60)} values are smaller; select(2): {bst.select(2)}")
+    bst.delete(30)
+    print(f"After delete(30): {bst.inorder()}")
+    
+    print("\nBulk loading 100,000 sorted keys:")
+    from time import perf_counter
+    start = perf_counter()
+    loaded = BinarySearchTree.from_sorted(range(100_000))
+    print(f"  from_sorted: {(perf_counter() - start) * 1000:.1f} ms, "
+          f"height {_depth(loaded.root)}")
+    start = perf_counter()
+    inserted = AVLTree()
+    for key in range(100_000):
+        inserted.insert(key)
+    print(f"  100,000 AVL inserts: {(perf_counter() - start) * 1000:.1f} ms")
+    evens = BinarySearchTree.from_iterable(range(0, 10, 2))
+    odds = BinarySearchTree.from_iterable([9, 3, 7, 1, 5])
+    print(f"  merge(evens, odds): {evens.merge(odds).inorder()}\n")
+    
+    pooled = PooledBinarySearchTree()
+    for val in [50, 30, 70, 20, 40, 60, 80]:
+        pooled.insert(val)
+    print(f"Pooled BST inorder: {pooled.inorder()} "
+          f"({len(pooled.pool)} nodes in parallel arrays)")
+    pooled.delete(30)
+    pooled.insert(35)  # reuses the slot freed by delete(30)
+    print(f"After delete(30), insert(35): {pooled.inorder()} "
+          f"({len(pooled.pool.data)} slots allocated)")
+    print("\nMemory per node (100k nodes):")
+    benchmark_node_memory(10**5)
+    print()
+    
+    avl = AVLTree()
+    for val in range(1, 16):
+        avl.insert(val)
+    print("AVL tree after inserting 1..15 in sorted order:")
+    print(f"  Height: {avl.root.height} (a plain BST would have height 15)")
+    avl.delete(8)
+    print(f"  After delete(8): {avl.inorder()}")
+    print("\nSorted vs random vs adversarial insert order (n=2000):")
+    benchmark_balancing()
+    print()
+    
+    print("B+ tree index (order 4):")
+    bplus = BPlusTree(order=4)
+    for val in [50, 30, 70, 20, 40, 60, 80, 10, 90]:
+        bplus.insert(val, f"row-{val}")
+    print(f"  Height: {bplus.height()}, keys: {len(bplus)}")
+    print(f"  get(60): {bplus.get(60)}")
+    print(f"  Range [25, 65] via leaf links: {list(bplus.range(25, 65))}")
+    bplus.delete(40)
+    print(f"  After delete(40): {list(bplus.range(0, 100))}")
+    print("\nBPlusTree vs BinarySearchTree, 100,000 keys:")
+    benchmark_bplus_tree(n=100_000, lookups=20_000, scans=200)
+    print()
+    
+    import io
+    snapshot = io.BytesIO()
+    inserted.dump(snapshot)
+    print(f"Snapshot of the 100,000-key AVL tree: {snapshot.tell():,} bytes")
+    snapshot.seek(0)
+    start = perf_counter()
+    restored = AVLTree.load(snapshot)
+    print(f"  load(): {(perf_counter() - start) * 1000:.1f} ms, "
+          f"{len(restored)} keys, height {restored.root.height}\n")
     
     print("="*50)
     print("3. FILE SYSTEM HIERARCHY")
     print("="*50)
     print()
     
-    root = file_system_demo()
-    root.display()
+    fs = file_system_demo()
+    fs.display()
+    
+    report = fs.resolve("/C:/Documents/report.pdf")
+    documents = fs.resolve("/C:/Documents")
+    print(f"\nresolve('/C:/Documents/report.pdf'): {report.size} bytes")
+    print(f"/C:/Documents holds {documents.file_count} files, "
+          f"{documents.total_size} bytes (kept incrementally)")
+    print(f"Walk: {[path for path, _ in fs.walk('/C:')]}")
     
     print("\n" + "="*50)
-    print("4. EXPRESSION TREE")
+    print("4. RADIX TRIE (AUTOCOMPLETE)")
+    print("="*50)
+    
+    trie = RadixTrie()
+    for word in ["car", "card", "care", "careful", "cat", "dog", "do"]:
+        trie.insert(word)
+    print(f"\nstarts_with('car'): {list(trie.starts_with('car'))}")
+    trie.delete("card")
+    print(f"after delete('card'): {list(trie.starts_with('ca'))}")
+    print("\nPrefix search on 100,000 random words:")
+    benchmark_prefix_search(n=100_000, queries=500)
+    
+    print("\n" + "="*50)
+    print("5. EXPRESSION TREE")
     print("="*50)
     
     result = expression_tree_demo()
-    print(f"\nExpression: (3 + 5) * 2 = {result}\n")
+    print(f"\nExpression: (3 + 5) * 2 = {result}")
+    
+    formula = ExpressionTree.from_postfix(
+        ['price', 'qty', '*', 1, 'discount', '-', '*', 100, 8, 5, '/', '*', '+'])
+    print(f"\nPricing formula: {formula.to_infix()}")
+    print(f"Compiled program: {len(formula.compile())} instructions "
+          f"(constant 100 * (8 / 5) folded to 160.0)")
+    orders = [{'price': 10, 'qty': 3, 'discount': 0.1},
+              {'price': 25, 'qty': 1, 'discount': 0.0}]
+    print(f"Batch evaluation: {formula.evaluate_many(orders)}\n")
     
     print("="*50)
     print("APPLICATIONS:")